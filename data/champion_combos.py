@@ -10,8 +10,19 @@ damage_components: list of damage sources in the combo.
   - 'label': human-readable ability name
 
 spell_order: suggested hotkey sequence shown in overlay.
+
+At import every combo also gets a '_soa' entry: a ComboVec holding the same
+components as parallel NumPy arrays (struct-of-arrays) so the calculator
+can evaluate the whole combo as one vectorized expression.
 """
 
+from collections import namedtuple
+from enum import IntEnum
+
+import numpy as np
+
+from data.champion_stats import champion_key
+
 CHAMPION_COMBOS = {
     "khazix": {
         "combo_label": "E → Q (isolated) → W → AA",
@@ -142,23 +153,78 @@ CHAMPION_COMBOS = {
 }
 
 
+# Same keys as data.champion_stats ("Kha'Zix" → "khazix")
+CHAMPION_COMBOS = {champion_key(k): v for k, v in CHAMPION_COMBOS.items()}
+
+
+# ── Struct-of-arrays layout ───────────────────────────────────────────────────
+class DamageType(IntEnum):
+    """Component damage type as stored in the int8 'type_code' array."""
+    PHYSICAL = 0
+    MAGIC    = 1
+    TRUE     = 2
+
+
+MAX_RANK       = 5
+TYPE_CODES     = {t.name.lower(): t for t in DamageType}     # 'physical' → PHYSICAL
+# Column in the rank vector built by spell_rank_vector;
+# rank-less components (None) read the trailing constant rank 1.
+_RANK_SLOT     = {"q": 0, "w": 1, "e": 2, "r": 3, None: -1}
+
+
+def _build_base_table() -> tuple[np.ndarray, dict]:
+    """
+    Every component of every champion in one (n_total, MAX_RANK) int16 table
+    (base damages are whole numbers), plus key → (start, end) row ranges.
+    Each base list is padded to MAX_RANK by repeating its last value, so the
+    rank lookup is a plain column index with no per-component min().
+    """
+    rows, ranges = [], {}
+    for key, combo in CHAMPION_COMBOS.items():
+        start = len(rows)
+        for c in combo["damage_components"]:
+            rows.append(c["base"] + [c["base"][-1]] * (MAX_RANK - len(c["base"])))
+        ranges[key] = (start, len(rows))
+    table = np.array(rows, dtype=np.int16)
+    table.flags.writeable = False
+    return table, ranges
+
+
+_BASE_TABLE, _CHAMP_RANGE = _build_base_table()
+
+
+# One row per component: base is a (n, MAX_RANK) view into _BASE_TABLE,
+# ad/ap/hp are ratios, type_code a DamageType, rank_idx a _RANK_SLOT column
+ComboVec = namedtuple("ComboVec", "base ad ap hp type_code rank_idx labels")
+
+
+def _compile_combo(combo: dict, base: np.ndarray) -> ComboVec:
+    """Pack damage_components into parallel arrays (one row per component)."""
+    comps = combo["damage_components"]
+    return ComboVec(
+        base      = base,
+        ad        = np.array([c.get("ad_ratio", 0) for c in comps], dtype=np.float64),
+        ap        = np.array([c.get("ap_ratio", 0) for c in comps], dtype=np.float64),
+        hp        = np.array([c.get("hp_ratio", 0) for c in comps], dtype=np.float64),
+        type_code = np.array([TYPE_CODES[c["type"]] for c in comps], dtype=np.int8),
+        rank_idx  = np.array([_RANK_SLOT[c.get("rank_index")] for c in comps], dtype=np.int8),
+        labels    = tuple(c["label"] for c in comps),
+    )
+
+
+for _key, _combo in CHAMPION_COMBOS.items():
+    _start, _end = _CHAMP_RANGE[_key]
+    _combo["_soa"] = _compile_combo(_combo, _BASE_TABLE[_start:_end])
+
+
 def get_combo(champion_name: str) -> dict:
-    key = (champion_name.lower()
-           .replace("'", "")
-           .replace(" ", "")
-           .replace(".", ""))
-    return CHAMPION_COMBOS.get(key, CHAMPION_COMBOS["_default"])
+    return CHAMPION_COMBOS.get(champion_key(champion_name), CHAMPION_COMBOS["_default"])
 
 
 # Spell rank lookup helpers
-RANK_INDEX_MAP = {"q": 0, "w": 1, "e": 2, "r": 3}
-
-def get_base_damage_at_rank(component: dict, spell_ranks: dict) -> float:
-    """Return base damage for ability at current rank."""
-    idx_key = component.get("rank_index")
-    if idx_key is None:
-        return component["base"][0] if component["base"] else 0
-    rank = spell_ranks.get(idx_key, 1)
-    base_list = component["base"]
-    rank_idx = min(rank - 1, len(base_list) - 1)
-    return base_list[rank_idx]
+def spell_rank_vector(spell_ranks: dict) -> np.ndarray:
+    """[q, w, e, r, 1] ranks, indexed by a compiled combo's rank_idx."""
+    return np.array([spell_ranks.get("q", 1), spell_ranks.get("w", 1),
+                     spell_ranks.get("e", 1), spell_ranks.get("r", 1), 1],
+                    dtype=np.int64)
+
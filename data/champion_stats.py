@@ -4,6 +4,11 @@ Source: community-dragon / League wiki (patch 26.x)
 Add more champions as needed.
 """
 
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
 CHAMPION_STATS = {
     # Junglers you'll face most often
     "belveth": {
@@ -136,18 +141,86 @@ CHAMPION_STATS = {
 }
 
 
-def get_champion_stats(champion_name: str) -> dict:
+# Riot display names (Live Client API "championName") of database entries
+CHAMPION_DISPLAY_NAMES = {
+    "belveth": "Bel'Veth",   "khazix": "Kha'Zix",      "jarvaniv": "Jarvan IV",
+    "vi": "Vi",              "nocturne": "Nocturne",   "warwick": "Warwick",
+    "masteryi": "Master Yi", "ekko": "Ekko",           "elise": "Elise",
+    "briar": "Briar",        "graves": "Graves",       "xinzhao": "Xin Zhao",
+    "reksai": "Rek'Sai",     "fiddlesticks": "Fiddlesticks",
+    "shaco": "Shaco",        "viego": "Viego",         "hecarim": "Hecarim",
+    "darius": "Darius",      "kayle": "Kayle",         "veigar": "Veigar",
+    "lucian": "Lucian",      "nautilus": "Nautilus",   "malzahar": "Malzahar",
+    "aphelios": "Aphelios",
+}
+
+# Display name → key: lowercase, strip apostrophes / spaces / dots ("Kha'Zix" → "khazix")
+_KEY_STRIP = str.maketrans("", "", "' .")
+
+
+def _normalize(name: str) -> str:
+    return name.lower().translate(_KEY_STRIP)
+
+
+ChampStats   = namedtuple("ChampStats", "base_armor armor_per_level base_mr "
+                                       "mr_per_level base_hp hp_per_level")
+StatsAtLevel = namedtuple("StatsAtLevel", "armor mr max_hp")
+
+# Re-key once at import so every lookup is a single dict hit on a normalized key,
+# and freeze each row into a ChampStats record
+CHAMPION_STATS = {_normalize(k): ChampStats(**v) for k, v in CHAMPION_STATS.items()}
+
+# Every name spelling seen at runtime → key. Seeded at import with each key and
+# its display name; anything else is normalized once on first sight and
+# remembered, so steady-state lookups are one dict hit with no string work.
+_DISPLAY_TO_KEY = {key: key for key in CHAMPION_STATS}
+for _key, _name in CHAMPION_DISPLAY_NAMES.items():
+    _DISPLAY_TO_KEY[_name] = _DISPLAY_TO_KEY[_name.lower()] = _key
+
+
+def champion_key(champion_name: str) -> str:
+    """Normalized database key for any spelling of a champion name."""
+    key = _DISPLAY_TO_KEY.get(champion_name)
+    if key is None:
+        key = _DISPLAY_TO_KEY[champion_name] = _normalize(champion_name)
+    return key
+
+
+def get_champion_stats(champion_name: str) -> ChampStats:
     """Return base stats for champion. Falls back to _default if unknown."""
-    key = champion_name.lower().replace("'", "").replace(" ", "").replace(".", "")
-    return CHAMPION_STATS.get(key, CHAMPION_STATS["_default"])
+    return CHAMPION_STATS.get(champion_key(champion_name), CHAMPION_STATS["_default"])
+
+
+# ── Precomputed (champion, level) → (armor, mr, max_hp) table ────────────────
+# Row per champion (including _default), level axis 0..18 (index 0 mirrors
+# level 1, matching the clamp below), last axis = armor / mr / max_hp.
+_CHAMP_IDX = {key: i for i, key in enumerate(CHAMPION_STATS)}
+_DEFAULT_IDX = _CHAMP_IDX["_default"]
+
+
+def _build_stats_table() -> np.ndarray:
+    def col(field):
+        return np.array([getattr(s, field) for s in CHAMPION_STATS.values()],
+                        dtype=np.float64)
+
+    steps = np.clip(np.arange(19, dtype=np.float64) - 1, 0, None)   # (lvl - 1)
+    table = np.empty((len(CHAMPION_STATS), 19, 3), dtype=np.float64)
+    table[..., 0] = col("base_armor")[:, None] + col("armor_per_level")[:, None] * steps
+    table[..., 1] = col("base_mr")[:, None]    + col("mr_per_level")[:, None]    * steps
+    table[..., 2] = col("base_hp")[:, None]    + col("hp_per_level")[:, None]    * steps
+    table.flags.writeable = False
+    return table
+
+
+_STATS_TABLE = _build_stats_table()
+
+
+@lru_cache(maxsize=1024)
+def _stats_at_level(key: str, lvl: int) -> StatsAtLevel:
+    """Python-float record for a normalized key and clamped level."""
+    return StatsAtLevel(*_STATS_TABLE[_CHAMP_IDX.get(key, _DEFAULT_IDX), lvl].tolist())
 
 
-def calculate_stats_at_level(champion_name: str, level: int) -> dict:
+def calculate_stats_at_level(champion_name: str, level: int) -> StatsAtLevel:
     """Calculate champion's total base stats at a given level."""
-    stats = get_champion_stats(champion_name)
-    lvl = max(1, min(18, level))
-    return {
-        "armor": stats["base_armor"] + stats["armor_per_level"] * (lvl - 1),
-        "mr":    stats["base_mr"]    + stats["mr_per_level"]    * (lvl - 1),
-        "max_hp": stats["base_hp"]   + stats["hp_per_level"]    * (lvl - 1),
-    }
+    return _stats_at_level(champion_key(champion_name), max(1, min(18, level)))
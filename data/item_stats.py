@@ -80,17 +80,53 @@ RUNE_ADJUSTMENTS = {
 }
 
 
+# Display name → key: lowercase, drop apostrophes, spaces/dashes → "_"
+# ("Randuin's Omen" → "randuins_omen")
+_KEY_TABLE = str.maketrans({"'": None, " ": "_", "-": "_"})
+
+
+def _normalize(name: str) -> str:
+    return name.lower().translate(_KEY_TABLE)
+
+
+# Re-key once at import so every lookup is a single dict hit on a normalized key
+ITEM_STATS          = {_normalize(k): v for k, v in ITEM_STATS.items()}
+ACTIVE_DAMAGE_ITEMS = {_normalize(k): v for k, v in ACTIVE_DAMAGE_ITEMS.items()}
+
+# Hot-path view of ITEM_STATS: one tuple per item instead of six dict probes
+#   (armor, mr, hp, passive_shield, active_shield, flags)
+ITEM_FLAG_REVIVE       = 1 << 0
+ITEM_FLAG_DEATHS_DANCE = 1 << 1
+ITEM_FAST_NONE = (0, 0, 0, None, None, 0)
+ITEM_FAST = {
+    k: (v.get("armor", 0), v.get("mr", 0), v.get("hp", 0),
+        v.get("passive_shield"), v.get("active_shield"),
+        (ITEM_FLAG_REVIVE if v.get("revive") else 0)
+        | (ITEM_FLAG_DEATHS_DANCE if k == "deaths_dance" else 0))
+    for k, v in ITEM_STATS.items()
+}
+
+# Keys of active items that actually deal damage (everything else is flag-only)
+ACTIVE_DAMAGE_KEYS = frozenset(k for k, v in ACTIVE_DAMAGE_ITEMS.items()
+                               if v.get("damage", 0) > 0)
+
+# Every item name spelling seen at runtime → key. Seeded with the table keys;
+# display names are normalized once on first sight and remembered.
+_NAME_TO_KEY = {key: key for key in (*ITEM_STATS, *ACTIVE_DAMAGE_ITEMS)}
+
+
+def item_key(item_name: str) -> str:
+    """Normalized table key for any spelling of an item name."""
+    key = _NAME_TO_KEY.get(item_name)
+    if key is None:
+        key = _NAME_TO_KEY[item_name] = _normalize(item_name)
+    return key
+
+
 def get_item_stats(item_name: str) -> dict:
     """Normalize item name and return stats dict."""
-    key = (item_name.lower()
-           .replace("'", "")
-           .replace(" ", "_")
-           .replace("-", "_"))
-    return ITEM_STATS.get(key, {})
+    return ITEM_STATS.get(item_key(item_name), {})
 
 
 def get_active_damage(item_name: str) -> dict:
-    key = (item_name.lower()
-           .replace("'", "")
-           .replace(" ", "_"))
-    return ACTIVE_DAMAGE_ITEMS.get(key, {})
+    return ACTIVE_DAMAGE_ITEMS.get(item_key(item_name), {})
@@ -32,12 +32,11 @@ except ImportError:
     print("ERROR: 'keyboard' not installed. Run: pip install keyboard")
     sys.exit(1)
 
-from modules.live_client    import (is_game_active, get_my_state,
-                                    get_enemies_state, get_my_team,
-                                    get_game_time)
+from modules.live_client    import get_game_snapshot
+from modules.live_client_worker import LiveClientChannel
 from modules.screen_reader  import read_enemy_hp_percents
 from modules.target_panel_reader import read_target_panel, calibrate_target_panel
-from modules.kill_calculator import calculate_kill_chance, format_result
+from modules.kill_calculator import calculate_kill_chance, format_result, get_pause_reason
 from modules.overlay         import get_overlay
 
 # ── Config ─────────────────────────────────────────────────────────────────────
@@ -46,7 +45,10 @@ TARGET_POSITION = "JUNGLE"  # prioritize enemy jungler; fallback to all
 HOTKEY_TOGGLE   = "ctrl+f1"   # show/hide overlay
 HOTKEY_HIDE     = "ctrl+f2"   # hide only
 HOTKEY_QUIT     = "ctrl+f3"   # full quit
+USE_LIVE_CLIENT_WORKER = True  # poll Live Client API in a child process
 CPU_THROTTLE_PCT = 75    # pause extra if CPU > this %
+CPU_SAMPLE_TICKS = 8     # sample CPU% every N ticks (~2.4s)
+CPU_EWMA_ALPHA   = 0.3   # weight of the newest CPU sample
 
 logging.basicConfig(
     level=logging.WARNING,
@@ -57,10 +59,15 @@ logger = logging.getLogger("main")
 
 # ── State ──────────────────────────────────────────────────────────────────────
 class AppState:
+    __slots__ = ("active", "running", "_lock", "_stop", "_cpu_tick", "_cpu_ewma")
+
     def __init__(self):
         self.active      = False
         self.running     = True
         self._lock       = threading.Lock()
+        self._stop       = threading.Event()  # set on quit — wakes every waiter
+        self._cpu_tick   = 0
+        self._cpu_ewma   = 0.0   # smoothed CPU%, refreshed every CPU_SAMPLE_TICKS
 
     def toggle(self):
         with self._lock:
@@ -72,11 +79,23 @@ class AppState:
         with self._lock:
             self.running = False
             self.active  = False
+        self._stop.set()
         print("Quitting...")
 
 
 app = AppState()
 _last_known_hp: dict = {}  # champion -> hp_percent, persists between ticks
+_last_display: tuple | None = None  # (text, verdict) last pushed to the overlay
+
+
+def _display(overlay, text: str, verdict: str):
+    """Update overlay only when content changed — most ticks repeat the last frame."""
+    global _last_display
+    if (text, verdict) != _last_display:
+        overlay.update(text, verdict)
+        _last_display = (text, verdict)
+    overlay.show()
+    overlay.pump()
 
 
 # ── Target selection ───────────────────────────────────────────────────────────
@@ -92,86 +111,133 @@ def set_locked_target(idx: int | None):
     else:
         print(f"[Target] Locked to slot {idx + 1}")
 
-def pick_target(enemies: list[dict], preferred_name: str | None = None) -> dict | None:
-    alive = [e for e in enemies if not e.get("is_dead", False)]
-    if not alive:
-        return None
+_slot_cache_key: tuple | None = None
+_slot_cache_line: str = ""
+
+def _slot_line(enemies: list[dict], lock_idx: int | None) -> str:
+    """'[1]Ahri  [*]Zed  ...' — rebuilt only when the roster or lock changes."""
+    global _slot_cache_key, _slot_cache_line
+    key = (lock_idx, tuple(e["champion"] for e in enemies))
+    if key != _slot_cache_key:
+        _slot_cache_line = "  ".join([
+            f"[{'*' if i == lock_idx else i+1}]{champ[:6]}"
+            for i, champ in enumerate(key[1])
+        ])
+        _slot_cache_key = key
+    return _slot_cache_line
 
+def pick_target(enemies: list[dict], preferred_name: str | None = None) -> dict | None:
     # Use locked index if set
     if _locked_target_idx is not None and _locked_target_idx < len(enemies):
         t = enemies[_locked_target_idx]
-        if not t.get("is_dead", False):
+        if not t["is_dead"]:
             return t
 
-    # Auto: lowest HP
-    return min(alive, key=lambda e: e.get("hp_percent") or 1.0)
+    # Auto: lowest HP among alive enemies (first one wins ties), single pass
+    best, best_hp = None, 2.0
+    for e in enemies:
+        if e["is_dead"]:
+            continue
+        hp = e["hp_percent"] or 1.0
+        if hp < best_hp:
+            best, best_hp = e, hp
+    return best
 
 
 # ── Main loop ──────────────────────────────────────────────────────────────────
 
 def main_loop():
+    # The overlay's tk window lives in this thread and is pumped every tick
     overlay = get_overlay()
+    overlay.start()
+    # One screen-capture handle for the whole session (None if mss missing)
+    try:
+        import mss
+        sct = mss.mss()
+    except Exception:
+        sct = None
+    # Live Client state arrives via shared memory from a polling process
+    live = None
+    if USE_LIVE_CLIENT_WORKER:
+        live = LiveClientChannel(poll_hz=1.0 / POLL_INTERVAL)
+        live.start()
     print(f"[{time.strftime('%H:%M:%S')}] LoL Kill Calculator ready.")
     print(f"  {HOTKEY_TOGGLE.upper()} — toggle on/off")
     print(f"  {HOTKEY_QUIT.upper()}  — quit")
 
-    while app.running:
-        time.sleep(POLL_INTERVAL)
+    next_tick = time.perf_counter()
+    while True:
+        # Deadline-based cadence: wait only what is left of this tick's budget;
+        # the wait returns immediately on quit
+        next_tick += POLL_INTERVAL
+        delay = next_tick - time.perf_counter()
+        if delay <= 0:
+            next_tick = time.perf_counter()  # slipped — don't try to catch up
+            delay = 0
+        if app._stop.wait(delay):
+            break
+        overlay.pump()
 
         if not app.active:
             overlay.hide()
+            overlay.pump()
+            if live:
+                live.set_paused(True)
             continue
-
-        print(f"[DEBUG] Loop tick - game_active check...")
-
-        # CPU throttle
-        cpu = psutil.cpu_percent(interval=None)
+        if live:
+            live.set_paused(False)
+
+        # CPU throttle — sampled every few ticks and smoothed
+        app._cpu_tick += 1
+        if app._cpu_tick % CPU_SAMPLE_TICKS == 0:
+            app._cpu_ewma = ((1 - CPU_EWMA_ALPHA) * app._cpu_ewma
+                             + CPU_EWMA_ALPHA * psutil.cpu_percent(interval=None))
+        cpu = app._cpu_ewma
         if cpu > CPU_THROTTLE_PCT:
-            logger.debug(f"CPU {cpu}% — throttling")
-            time.sleep(0.5)
+            logger.debug("CPU %.0f%% — throttling", cpu)
+            if app._stop.wait(0.5):
+                break
+            next_tick = time.perf_counter()  # full POLL_INTERVAL after backing off
             continue
 
+        # Fetch data — latest worker snapshot, or poll inline if worker disabled
+        snap = live.read() if live else get_game_snapshot()
+        if snap is None and live and live.pending():
+            continue      # worker hasn't published since resume — keep the last frame
+
         # Check game is running
-        if not is_game_active():
-            print("[DEBUG] Game not active")
-            overlay.update("[ WAITING ] No active game detected...", "PAUSED")
-            overlay.show()
+        if not snap or not snap["game_active"]:
+            _display(overlay, "[ WAITING ] No active game detected...", "PAUSED")
             continue
-        print("[DEBUG] Game active, fetching state...")
 
-        # Fetch data
-        my_state  = get_my_state()
-        game_time = get_game_time()
+        my_state  = snap["my_state"]
+        game_time = snap["game_time"]
 
         if not my_state:
-            overlay.update("[ ERROR ] Cannot reach Live Client API", "PAUSED")
-            overlay.show()
+            _display(overlay, "[ ERROR ] Cannot reach Live Client API", "PAUSED")
             continue
 
-        my_team   = get_my_team()
-        enemies   = get_enemies_state(my_team)
+        my_team   = snap["my_team"]
+        enemies   = snap["enemies"]
 
-        print(f"[DEBUG] champion={my_state.get('champion')} enemies={len(enemies)} team={my_team} hp={my_state.get('hp_percent'):.2f} game_time={game_time:.0f}")
+        logger.debug("champion=%s enemies=%d team=%s hp=%.2f game_time=%.0f",
+                     my_state.get("champion"), len(enemies), my_team,
+                     my_state.get("hp_percent"), game_time)
 
         if not enemies:
-            overlay.update("[ WAITING ] No enemy data yet...", "PAUSED")
-            overlay.show()
+            _display(overlay, "[ WAITING ] No enemy data yet...", "PAUSED")
             continue
 
         # Read target panel (top-left, after clicking enemy)
-        sct = getattr(get_overlay(), '_sct', None)
         try:
-            import mss as _mss
-            if not hasattr(main_loop, '_sct'):
-                main_loop._sct = _mss.mss()
-            panel = read_target_panel(main_loop._sct)
+            panel = read_target_panel(sct) if sct else {}
         except Exception:
             panel = {}
 
         target = pick_target(enemies)
 
         # If panel active, inject real-time HP into target and cache it
-        champ_key = target.get("champion", "") if target else ""
+        champ_key = target["champion"] if target else ""
         if panel.get("panel_active") and target:
             if panel.get("hp_percent") is not None:
                 target["hp_percent"]  = panel["hp_percent"]
@@ -184,20 +250,22 @@ def main_loop():
             # Panel not detected this tick — use last known HP instead of 100%
             target["hp_percent"] = _last_known_hp[champ_key]
 
-        # Build enemy slot line for overlay header
-        lock_idx = _locked_target_idx
-        slot_line = "  ".join(
-            f"[{'*' if i == lock_idx else i+1}]{e.get('champion','?')[:6]}"
-            for i, e in enumerate(enemies)
-        )
+        # Enemy slot line for overlay header
+        slot_line = _slot_line(enemies, _locked_target_idx)
 
         if target is None:
-            overlay.update("[ WAITING ] All enemies dead / no target", "PAUSED")
-            overlay.show()
+            _display(overlay, "[ WAITING ] All enemies dead / no target", "PAUSED")
+            continue
+
+        # Auto-pause states skip the calculator entirely; _display() drops the
+        # redraw while the pause message is unchanged
+        pause = get_pause_reason(my_state, target, game_time, my_state.get("hp_percent"))
+        if pause:
+            _display(overlay, f"{slot_line}\n[ PAUSED ] {pause[1]}", "PAUSED")
             continue
 
         # Run calculator
-        final_hp = target.get("hp_percent")  # real-time if panel active, else estimated
+        final_hp = target["hp_percent"]  # real-time if panel active, else estimated
 
         try:
             result = calculate_kill_chance(
@@ -210,24 +278,25 @@ def main_loop():
             )
         except Exception as calc_err:
             logger.warning(f"Calculator error: {calc_err}")
-            overlay.update("[ ERROR ] Calculation failed — retrying...", "PAUSED")
-            overlay.show()
+            _display(overlay, "[ ERROR ] Calculation failed — retrying...", "PAUSED")
             continue
 
         # Format and display
         text = f"{slot_line}\n{format_result(result)}"
         verdict = "PAUSED" if result.paused else result.verdict
-        panel_str = f"HP={panel.get('hp_current')}/{panel.get('hp_max')}" if panel.get('panel_active') else "panel=off"
-        print(f"[DEBUG] Verdict: {verdict} | Target: {target.get('champion')} | {panel_str} | conf={result.confidence:.0%} | myHP={my_state.get('hp_percent'):.0%}")
-        overlay.update(text, verdict)
-        overlay.show()
+        _display(overlay, text, verdict)
+
+        # Console log for debugging — strings only built when DEBUG is on
+        if logger.isEnabledFor(logging.DEBUG):
+            panel_str = f"HP={panel.get('hp_current')}/{panel.get('hp_max')}" if panel.get('panel_active') else "panel=off"
+            logger.debug(
+                f"Verdict: {verdict} | Target: {target['champion']} | {panel_str} | "
+                f"conf={result.confidence:.0%} | myHP={my_state.get('hp_percent'):.0%} | "
+                f"dmg={result.real_damage:.0f} effHP={result.enemy_effective_hp:.0f}"
+            )
 
-        # Console log for debugging
-        logger.debug(
-            f"[{target['champion']}] verdict={result.verdict} "
-            f"conf={result.confidence:.0%} dmg={result.real_damage:.0f} "
-            f"effHP={result.enemy_effective_hp:.0f}"
-        )
+    if live:
+        live.close()
 
 
 # ── Entry ──────────────────────────────────────────────────────────────────────
@@ -248,9 +317,8 @@ def main():
 
     print(f"Hotkeys: {HOTKEY_TOGGLE.upper()} toggle | {HOTKEY_HIDE.upper()} hide | {HOTKEY_QUIT.upper()} quit")
 
-    # Keep main thread alive for keyboard hooks
-    while app.running:
-        time.sleep(0.1)
+    # Keep main thread alive for keyboard hooks — blocks until quit, no polling
+    app._stop.wait()
 
     print("Goodbye.")
     sys.exit(0)
@@ -0,0 +1,143 @@
+"""
+Kill calculator kernels — pure-numeric hot paths.
+
+Operate on the struct-of-arrays combo layout (ComboVec) from data.champion_combos.
+Compiled with Numba when it is installed (pip install numba); otherwise
+the same names resolve to plain NumPy implementations.
+"""
+
+import logging
+import numpy as np
+
+from data.champion_combos import CHAMPION_COMBOS, DamageType, spell_rank_vector
+
+logger = logging.getLogger(__name__)
+
+# Numba is optional — same pattern as mss/cv2 in screen_reader
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Plain ints so Numba freezes them as compile-time constants
+_PHYSICAL = int(DamageType.PHYSICAL)
+_MAGIC    = int(DamageType.MAGIC)
+_TRUE     = int(DamageType.TRUE)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def combo_damage(base, ad_r, ap_r, hp_r, type_code, rank_idx, ranks,
+                     ad, ap, hp_max):
+        """
+        Raw (pre-mitigation) combo damage as (physical, magic, true).
+
+        base:      (n, 5) base damage per rank
+        ad_r/ap_r/hp_r: (n,) ratios (hp ratio = % of target max HP)
+        type_code: (n,) DamageType codes
+        rank_idx:  (n,) slot into `ranks` (-1 = rank-less → trailing 1)
+        ranks:     spell_rank_vector() output
+        """
+        phys = 0.0
+        magic = 0.0
+        true = 0.0
+        last = base.shape[1] - 1
+        for i in range(base.shape[0]):
+            col = min(ranks[rank_idx[i]] - 1, last)
+            raw = base[i, col] + ad * ad_r[i] + ap * ap_r[i] + hp_max * hp_r[i]
+            t = type_code[i]
+            if t == _PHYSICAL:
+                phys += raw
+            elif t == _MAGIC:
+                magic += raw
+            else:
+                true += raw
+        return phys, magic, true
+
+else:
+    def combo_damage(base, ad_r, ap_r, hp_r, type_code, rank_idx, ranks,
+                     ad, ap, hp_max):
+        """
+        NumPy fallback — see the Numba version above for argument layout.
+        Combos have < 8 components, where NumPy's pairwise .sum() is a plain
+        left-to-right loop, so the sums match the Numba version exactly.
+        """
+        cols = np.minimum(ranks[rank_idx] - 1, base.shape[1] - 1)
+        raw  = base[np.arange(len(cols)), cols] + ad * ad_r + ap * ap_r + hp_max * hp_r
+        return (float(raw[type_code == _PHYSICAL].sum()),
+                float(raw[type_code == _MAGIC].sum()),
+                float(raw[type_code == _TRUE].sum()))
+
+
+def _jit(fn):
+    """njit when Numba is available, plain Python otherwise (no fastmath:
+    these must match the scalar reference math bit-for-bit)."""
+    return njit(cache=True)(fn) if NUMBA_AVAILABLE else fn
+
+
+@_jit
+def effective_armor(base_armor, lethality, pen_pct, level):
+    """Armor after % pen, then lethality (flat pen scaled by level)."""
+    flat_pen = lethality * (0.6 + 0.4 * level / 18)
+    armor_after_pct = base_armor * (1 - pen_pct)
+    return max(0.0, armor_after_pct - flat_pen)
+
+
+@_jit
+def dmg_reduction(eff_armor):
+    """Armor → damage multiplier (1.0 = no reduction)."""
+    if eff_armor >= 0:
+        return 100.0 / (100.0 + eff_armor)
+    return 2.0 - 100.0 / (100.0 - eff_armor)   # negative armor → bonus damage
+
+
+@_jit
+def mr_reduction(eff_mr):
+    return 100.0 / (100.0 + max(0.0, eff_mr))
+
+
+@_jit
+def kill_core(base, ad_r, ap_r, hp_r, type_code, rank_idx, ranks,
+              total_ad, ap, hp_max, armor, mr,
+              lethality, pen_pct, level, magic_pen_flat,
+              act_dmg, act_phys,
+              current_hp, shield_total, eff_hp_mul, hp_mul, my_dmg_mul):
+    """
+    The whole numeric part of calculate_kill_chance in one call.
+
+    act_dmg / act_phys: (k,) damage of each damaging active item in build
+                        order, and whether it is mitigated by armor
+    Returns (phys_raw, magic_raw, phys_mult, active_dmg, total_dealt,
+             effective_hp, kill_ratio); effective_hp is before summoner
+             modifiers (what the overlay shows), kill_ratio after.
+    """
+    phys, magic, true = combo_damage(base, ad_r, ap_r, hp_r, type_code, rank_idx,
+                                     ranks, total_ad, ap, hp_max)
+    phys_raw = phys + true                      # true damage bucketed with physical
+
+    phys_mult  = dmg_reduction(effective_armor(armor, lethality, pen_pct, level))
+    magic_mult = mr_reduction(max(0.0, mr - magic_pen_flat))
+    total_dealt = phys_raw * phys_mult + magic * magic_mult
+
+    active_dmg = 0.0
+    for i in range(act_dmg.shape[0]):
+        dmg = float(act_dmg[i])                 # keep the no-Numba path in Python floats
+        active_dmg += dmg * phys_mult if act_phys[i] else dmg
+    total_dealt += active_dmg
+
+    effective_hp = (current_hp + shield_total) * eff_hp_mul
+    kill_ratio   = total_dealt * my_dmg_mul / max(effective_hp * hp_mul, 1.0)
+    return phys_raw, magic, phys_mult, active_dmg, total_dealt, effective_hp, kill_ratio
+
+
+def _warm_up():
+    """Compile (or load from cache) on the _default combo so the first tick isn't stalled."""
+    soa = CHAMPION_COMBOS["_default"]["_soa"]
+    kill_core(soa.base, soa.ad, soa.ap, soa.hp, soa.type_code,
+              soa.rank_idx, spell_rank_vector({}), 50.0, 0.0, 1000.0, 30.0, 30.0,
+              0.0, 0.0, 1.0, 0.0, np.zeros(1), np.zeros(1, dtype=np.bool_),
+              1000.0, 0.0, 1.0, 1.0, 1.0)
+
+
+_warm_up()
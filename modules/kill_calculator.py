@@ -7,13 +7,20 @@ Output: KillCalcResult with damage breakdown, confidence, flags, suggestion.
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 import logging
 
+import numpy as np
+
 from data.champion_stats  import calculate_stats_at_level
-from data.item_stats       import (ITEM_STATS, SUMMONER_ADJUSTMENTS,
-                                   get_item_stats, get_active_damage)
-from data.champion_combos  import get_combo, get_base_damage_at_rank
+from data.item_stats       import (SUMMONER_ADJUSTMENTS,
+                                   ACTIVE_DAMAGE_ITEMS, ACTIVE_DAMAGE_KEYS,
+                                   ITEM_FAST, ITEM_FAST_NONE,
+                                   ITEM_FLAG_REVIVE, ITEM_FLAG_DEATHS_DANCE,
+                                   item_key)
+from data.champion_combos  import get_combo, spell_rank_vector
+from modules.kill_calc_kernels import kill_core
 
 logger = logging.getLogger(__name__)
 
@@ -25,9 +32,17 @@ THRESHOLD_RISKY    = 0.60   # 60–79% → RISKY
 # Minimum my HP% to even consider engaging
 MIN_MY_HP_TO_ENGAGE = 0.35
 
+# Items whose proc/active is on a cooldown we can't observe
+_ITEM_CD_FLAGS = {
+    "eclipse":            "Eclipse proc (6s CD) — unknown state",
+    "immortal_shieldbow": "Shieldbow shield (90s CD) — unknown state",
+    "steraks_gage":       "Sterak's shield (60s CD) — unknown state",
+    "gargoyle_stoneplate":"Gargoyle active (90s CD) — unknown state",
+}
+
 # ── Result dataclass ───────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class KillCalcResult:
     enemy_champion:     str
     my_champion:        str
@@ -68,74 +83,139 @@ class KillCalcResult:
 
 # ── Utility functions ──────────────────────────────────────────────────────────
 
-def _normalize_item_key(name: str) -> str:
-    return (name.lower()
-            .replace("'", "")
-            .replace(" ", "_")
-            .replace("-", "_"))
+# ── Enemy build profile ────────────────────────────────────────────────────────
+# Everything derived from an enemy's items + summoner spells. Builds change a
+# few times per game, so this is computed once per distinct build (lru_cache)
+# instead of walking the item/summoner tables every tick.
+
+@dataclass(frozen=True)
+class EnemyProfile:
+    bonus_armor:        float = 0.0
+    bonus_mr:           float = 0.0
+    bonus_hp:           float = 0.0
+    shield_total:       float = 0.0    # flat shields added to effective HP
+    eff_hp_mul:         float = 1.0    # item effects (Death's Dance)
+    hp_mul:             float = 1.0    # summoner effects (Barrier, Heal, ...)
+    my_dmg_mul:         float = 1.0    # Exhaust etc.
+    confidence_penalty: float = 0.0
+    item_shields:       tuple = ()
+    item_revive:        bool  = False
+    death_dance_flag:   bool  = False
+    item_flags:         tuple = ()
+    summoner_warnings:  tuple = ()
+
+
+@lru_cache(maxsize=256)
+def _enemy_profile(items: tuple, summoners: tuple) -> EnemyProfile:
+    armor = mr = hp = 0.0
+    shield_total = 0.0
+    eff_hp_mul = hp_mul = my_dmg_mul = 1.0
+    penalty = 0.0
+    item_shields = []
+    item_revive = death_dance_flag = False
+    item_flags = []
+    summoner_warnings = []
 
+    for item_name in items:
+        a, m, h, passive, active, flags = ITEM_FAST.get(item_key(item_name), ITEM_FAST_NONE)
+        armor += a
+        mr    += m
+        hp    += h
+
+        if passive:
+            item_shields.append((item_name, passive))
+        if active:
+            item_shields.append((item_name, f"+{int(active*100)}% maxHP"))
+        if flags & ITEM_FLAG_REVIVE:
+            item_revive = True
+        if flags & ITEM_FLAG_DEATHS_DANCE:
+            death_dance_flag = True
 
-def _calc_effective_armor(base_armor: float, my_state: dict) -> float:
-    """Apply armor penetration from my stats."""
-    lethality    = my_state.get("lethality", 0)
-    pen_pct      = my_state.get("armor_pen_pct", 0)  # 0.0–1.0
-    level        = my_state.get("level", 1)
+    # Item shield flags
+    for item_name, shield_val in item_shields:
+        if isinstance(shield_val, (int, float)):
+            shield_total += shield_val
+            item_flags.append(f"⚠ {item_name}: +{shield_val:.0f} shield")
+        else:
+            item_flags.append(f"⚠ {item_name}: {shield_val} shield")
+        penalty += 0.08
 
-    # Lethality → flat pen scaled by level
-    flat_pen = lethality * (0.6 + 0.4 * level / 18)
+    if death_dance_flag:
+        # Death's Dance delays 30% dmg — treat as ~15% effective HP increase
+        eff_hp_mul = 1.15
+        item_flags.append("⚠ Death's Dance: 30% dmg delayed")
+        penalty += 0.05
 
-    armor_after_pct  = base_armor * (1 - pen_pct)
-    armor_after_flat = max(0.0, armor_after_pct - flat_pen)
-    return armor_after_flat
+    if item_revive:
+        item_flags.append("🔴 Guardian Angel: revive possible")
+        penalty += 0.20
 
+    # Summoner spell flags
+    for s in summoners:
+        adj = SUMMONER_ADJUSTMENTS.get(s, {})
+        if "hp_modifier" in adj:
+            hp_mul *= adj["hp_modifier"]
+            summoner_warnings.append(
+                f"⚠ {adj['label']}: ×{adj['hp_modifier']} effective HP")
+            penalty += 0.08
+        if "my_dmg_modifier" in adj:
+            my_dmg_mul *= adj["my_dmg_modifier"]
+            summoner_warnings.append(
+                f"⚠ {adj['label']}: your dmg ×{adj['my_dmg_modifier']}")
+            penalty += 0.12
 
-def _dmg_reduction(effective_armor: float) -> float:
-    """Armor → damage multiplier (1.0 = no reduction)."""
-    if effective_armor >= 0:
-        return 100.0 / (100.0 + effective_armor)
-    else:  # negative armor → bonus damage
-        return 2.0 - 100.0 / (100.0 - effective_armor)
+    # Eclipse / unknown item CD flag
+    for item_name in items:
+        key = item_key(item_name)
+        if key in _ITEM_CD_FLAGS:
+            item_flags.append(f"⚠ {_ITEM_CD_FLAGS[key]}")
+            penalty += 0.05  # small penalty per flagged item
+
+    return EnemyProfile(
+        bonus_armor        = armor,
+        bonus_mr           = mr,
+        bonus_hp           = hp,
+        shield_total       = shield_total,
+        eff_hp_mul         = eff_hp_mul,
+        hp_mul             = hp_mul,
+        my_dmg_mul         = my_dmg_mul,
+        confidence_penalty = penalty,
+        item_shields       = tuple(item_shields),
+        item_revive        = item_revive,
+        death_dance_flag   = death_dance_flag,
+        item_flags         = tuple(item_flags),
+        summoner_warnings  = tuple(summoner_warnings),
+    )
 
 
-def _mr_reduction(effective_mr: float) -> float:
-    return 100.0 / (100.0 + max(0.0, effective_mr))
+def precompute_enemy_profile(enemy: dict) -> EnemyProfile:
+    """
+    Attach the EnemyProfile for this enemy's build as enemy["_profile"].
+    Only recomputed when enemy["items_hash"] (items + summoners) changes.
+    """
+    items     = tuple(enemy.get("items", []))
+    summoners = tuple(enemy.get("summoners", []))
+    items_hash = hash((items, summoners))
+    if enemy.get("items_hash") != items_hash or "_profile" not in enemy:
+        enemy["_profile"]   = _enemy_profile(items, summoners)
+        enemy["items_hash"] = items_hash
+    return enemy["_profile"]
 
 
 def _build_enemy_stats(enemy: dict, hp_percent_override: Optional[float]) -> dict:
     """Calculate enemy's actual armor/MR/HP from level + items."""
     champ  = enemy.get("champion", "_default")
     level  = enemy.get("level", 1)
-    items  = enemy.get("items", [])
+    profile = precompute_enemy_profile(enemy)
 
     base   = calculate_stats_at_level(champ, level)
-    armor  = base["armor"]
-    mr     = base["mr"]
-    max_hp = base["max_hp"]
+    max_hp = base.max_hp
 
     # If real-time max HP was read from panel, use it instead of calculated
     # This captures actual build (items + runes + growth) accurately
     if enemy.get("hp_max_real"):
         max_hp = float(enemy["hp_max_real"])
-
-    item_shields = []
-    item_revive  = False
-    death_dance_flag = False
-
-    for item_name in items:
-        key   = _normalize_item_key(item_name)
-        stats = ITEM_STATS.get(key, {})
-        armor  += stats.get("armor",  0)
-        mr     += stats.get("mr",     0)
-        max_hp += stats.get("hp",     0)
-
-        if stats.get("passive_shield"):
-            item_shields.append((item_name, stats["passive_shield"]))
-        if stats.get("active_shield"):
-            item_shields.append((item_name, f"+{int(stats['active_shield']*100)}% maxHP"))
-        if stats.get("revive"):
-            item_revive = True
-        if key == "deaths_dance":
-            death_dance_flag = True
+    max_hp += profile.bonus_hp
 
     hp_pct = hp_percent_override if hp_percent_override is not None \
              else enemy.get("hp_percent", 1.0)
@@ -145,55 +225,39 @@ def _build_enemy_stats(enemy: dict, hp_percent_override: Optional[float]) -> dic
     current_hp = max_hp * hp_pct
 
     return {
-        "armor":            armor,
-        "mr":               mr,
+        "armor":            base.armor + profile.bonus_armor,
+        "mr":               base.mr + profile.bonus_mr,
         "max_hp":           max_hp,
         "current_hp":       current_hp,
         "hp_percent":       hp_pct,
-        "item_shields":     item_shields,
-        "item_revive":      item_revive,
-        "death_dance_flag": death_dance_flag,
+        "item_shields":     list(profile.item_shields),
+        "item_revive":      profile.item_revive,
+        "death_dance_flag": profile.death_dance_flag,
+        "profile":          profile,
     }
 
 
-def _calculate_combo_damage(my_state: dict, enemy_stats: dict,
-                             spell_ranks: dict) -> tuple[float, float, list]:
+# ── Main calculator ────────────────────────────────────────────────────────────
+
+def get_pause_reason(my_state: dict, enemy: dict, game_time: float,
+                     my_hp_percent: Optional[float] = None) -> Optional[tuple[str, str]]:
     """
-    Returns (physical_damage, magic_damage, damage_breakdown_list).
+    Auto-pause check, cheap enough to run before any stats work.
+    Returns (reason_code, message) when calculate_kill_chance would pause,
+    else None. reason_code is one of: pregame, low_hp, enemy_dead, late_game.
     """
-    champ = my_state.get("champion", "_default")
-    combo = get_combo(champ)
-    total_ad = my_state.get("total_ad", 50)
-    ap       = my_state.get("ap", 0)
-    max_hp_enemy = enemy_stats.get("max_hp", 1000)
-
-    phys_dmg  = 0.0
-    magic_dmg = 0.0
-    breakdown = []
-
-    for comp in combo["damage_components"]:
-        base = get_base_damage_at_rank(comp, spell_ranks)
-        ad_r = comp.get("ad_ratio", 0)
-        ap_r = comp.get("ap_ratio", 0)
-        hp_r = comp.get("hp_ratio", 0)  # % of target max HP
-
-        raw = base + (total_ad * ad_r) + (ap * ap_r) + (max_hp_enemy * hp_r)
-
-        breakdown.append({
-            "label": comp["label"],
-            "damage": round(raw, 1),
-            "type":  comp["type"],
-        })
-
-        if comp["type"] in ("physical", "true"):
-            phys_dmg += raw
-        else:
-            magic_dmg += raw
-
-    return phys_dmg, magic_dmg, breakdown
+    my_hp = my_hp_percent or my_state.get("hp_percent", 1.0)
 
+    if game_time > 0 and game_time < 10:
+        return "pregame", "Pre-game (< 10s)"
+    if my_hp < MIN_MY_HP_TO_ENGAGE:
+        return "low_hp", f"Your HP too low ({my_hp:.0%})"
+    if enemy.get("is_dead", False):
+        return "enemy_dead", "Enemy is dead"
+    if game_time > 45 * 60:
+        return "late_game", "Late game (>45min) — calc unreliable"
+    return None
 
-# ── Main calculator ────────────────────────────────────────────────────────────
 
 def calculate_kill_chance(
     my_state:            dict,
@@ -219,26 +283,10 @@ def calculate_kill_chance(
     )
 
     # ── Auto-pause checks ──────────────────────────────────────────────────────
-    my_hp = my_hp_percent or my_state.get("hp_percent", 1.0)
-
-    if game_time > 0 and game_time < 10:
+    pause = get_pause_reason(my_state, enemy, game_time, my_hp_percent)
+    if pause:
         result.paused = True
-        result.pause_reason = "Pre-game (< 10s)"
-        return result
-
-    if my_hp < MIN_MY_HP_TO_ENGAGE:
-        result.paused = True
-        result.pause_reason = f"Your HP too low ({my_hp:.0%})"
-        return result
-
-    if enemy.get("is_dead", False):
-        result.paused = True
-        result.pause_reason = "Enemy is dead"
-        return result
-
-    if game_time > 45 * 60:
-        result.paused = True
-        result.pause_reason = "Late game (>45min) — calc unreliable"
+        result.pause_reason = pause[1]
         return result
 
     # ── Build enemy stats ──────────────────────────────────────────────────────
@@ -250,93 +298,63 @@ def calculate_kill_chance(
     result.enemy_current_hp = enemy_stats["current_hp"]
     result.enemy_hp_percent = enemy_stats["hp_percent"]
 
-    # ── Calculate damage ───────────────────────────────────────────────────────
+    # ── My stats — one extraction pass, scalars from here on ──────────────────
+    total_ad    = float(my_state.get("total_ad", 50))
+    ap          = float(my_state.get("ap", 0))
+    lethality   = float(my_state.get("lethality", 0))
+    pen_pct     = float(my_state.get("armor_pen_pct", 0))
+    level       = float(my_state.get("level", 1))
+    magic_pen   = float(my_state.get("magic_pen_flat", 0))
+    my_items    = my_state.get("items", [])
     spell_ranks = my_state.get("spell_ranks", {"q":1,"w":1,"e":1,"r":1})
 
-    phys_raw, magic_raw, breakdown = _calculate_combo_damage(
-        my_state, enemy_stats, spell_ranks)
-
-    # Resistance reductions
-    eff_armor = _calc_effective_armor(enemy_stats["armor"], my_state)
-    eff_mr    = max(0.0, enemy_stats["mr"] - my_state.get("magic_pen_flat", 0))
-
-    phys_dealt  = phys_raw  * _dmg_reduction(eff_armor)
-    magic_dealt = magic_raw * _mr_reduction(eff_mr)
-    total_dealt = phys_dealt + magic_dealt
-
-    # Active damage items
-    active_dmg = 0.0
-    active_items_used = []
-    for item_name in my_state.get("items", []):
-        act = get_active_damage(item_name)
-        if act.get("damage", 0) > 0:
-            d = act["damage"] * _dmg_reduction(eff_armor) \
-                if act.get("type") == "physical" else act["damage"]
-            active_dmg += d
-            active_items_used.append(f"{item_name} (+{d:.0f})")
-
-    total_dealt += active_dmg
+    # ── Calculate damage ───────────────────────────────────────────────────────
+    combo       = get_combo(my_state.get("champion", "_default"))
+    soa         = combo["_soa"]
+
+    # Damaging active items, in build order
+    active_items = []
+    for item_name in my_items:
+        key = item_key(item_name)
+        if key in ACTIVE_DAMAGE_KEYS:
+            active_items.append((item_name, ACTIVE_DAMAGE_ITEMS[key]))
+    act_dmg  = np.array([act["damage"] for _, act in active_items], dtype=np.float64)
+    act_phys = np.array([act.get("type") == "physical" for _, act in active_items],
+                        dtype=np.bool_)
+
+    # Item shields / Death's Dance / summoners / CD flags are folded into the
+    # cached build profile — see _enemy_profile()
+    profile = enemy_stats["profile"]
+
+    # Combo damage, resistances, active items and effective HP — one kernel call
+    (phys_raw, magic_raw, phys_mult, active_dmg, total_dealt,
+     effective_hp, kill_ratio) = kill_core(
+        soa.base, soa.ad, soa.ap, soa.hp, soa.type_code, soa.rank_idx,
+        spell_rank_vector(spell_ranks),
+        total_ad, ap, float(enemy_stats["max_hp"]),
+        float(enemy_stats["armor"]), float(enemy_stats["mr"]),
+        lethality, pen_pct, level, magic_pen,
+        act_dmg, act_phys,
+        float(enemy_stats["current_hp"]), float(profile.shield_total),
+        profile.eff_hp_mul, profile.hp_mul, profile.my_dmg_mul)
+
+    active_items_used = [
+        f"{item_name} (+{act['damage'] * phys_mult if phys else act['damage']:.0f})"
+        for (item_name, act), phys in zip(active_items, act_phys)
+    ]
 
     result.raw_damage         = round(phys_raw + magic_raw, 1)
     result.real_damage        = round(total_dealt, 1)
     result.active_item_damage = round(active_dmg, 1)
 
     # ── Build effective HP (enemy) ─────────────────────────────────────────────
-    effective_hp = enemy_stats["current_hp"]
-    confidence_penalty = 0.0
-
-    # Item shield flags
-    for item_name, shield_val in enemy_stats["item_shields"]:
-        if isinstance(shield_val, (int, float)):
-            effective_hp += shield_val
-            result.item_flags.append(f"⚠ {item_name}: +{shield_val:.0f} shield")
-        else:
-            result.item_flags.append(f"⚠ {item_name}: {shield_val} shield")
-        confidence_penalty += 0.08
-
-    if enemy_stats["death_dance_flag"]:
-        # Death's Dance delays 30% dmg — treat as ~15% effective HP increase
-        effective_hp *= 1.15
-        result.item_flags.append("⚠ Death's Dance: 30% dmg delayed")
-        confidence_penalty += 0.05
-
-    if enemy_stats["item_revive"]:
-        result.item_flags.append("🔴 Guardian Angel: revive possible")
-        confidence_penalty += 0.20
+    confidence_penalty = profile.confidence_penalty
+    result.item_flags.extend(profile.item_flags)
 
     result.enemy_effective_hp = round(effective_hp, 1)
 
     # ── Summoner spell flags ───────────────────────────────────────────────────
-    enemy_summoners = enemy.get("summoners", [])
-    dmg_modifier = 1.0
-
-    for s in enemy_summoners:
-        adj = SUMMONER_ADJUSTMENTS.get(s, {})
-        if "hp_modifier" in adj:
-            effective_hp *= adj["hp_modifier"]
-            result.summoner_warnings.append(
-                f"⚠ {adj['label']}: ×{adj['hp_modifier']} effective HP")
-            confidence_penalty += 0.08
-        if "my_dmg_modifier" in adj:
-            dmg_modifier *= adj["my_dmg_modifier"]
-            result.summoner_warnings.append(
-                f"⚠ {adj['label']}: your dmg ×{adj['my_dmg_modifier']}")
-            confidence_penalty += 0.12
-
-    adjusted_dealt = total_dealt * dmg_modifier
-
-    # ── Eclipse / unknown item CD flag ────────────────────────────────────────
-    ITEM_CD_FLAGS = {
-        "eclipse":            "Eclipse proc (6s CD) — unknown state",
-        "immortal_shieldbow": "Shieldbow shield (90s CD) — unknown state",
-        "steraks_gage":       "Sterak's shield (60s CD) — unknown state",
-        "gargoyle_stoneplate":"Gargoyle active (90s CD) — unknown state",
-    }
-    for item_name in enemy.get("items", []):
-        key = _normalize_item_key(item_name)
-        if key in ITEM_CD_FLAGS:
-            result.item_flags.append(f"⚠ {ITEM_CD_FLAGS[key]}")
-            confidence_penalty += 0.05  # small penalty per flagged item
+    result.summoner_warnings.extend(profile.summoner_warnings)
 
     # ── Phase Rush flag ────────────────────────────────────────────────────────
     # Can't detect rune directly, but flag it as reminder
@@ -344,7 +362,6 @@ def calculate_kill_chance(
         result.flags.append("Solo engage — watch for Phase Rush / Flash escape")
 
     # ── Kill ratio & confidence ────────────────────────────────────────────────
-    kill_ratio  = adjusted_dealt / max(effective_hp, 1.0)
     # Base confidence tracks kill ratio, capped at 0.97
     base_conf   = min(0.97, kill_ratio)
     # Confidence reduced by uncertainty flags
@@ -363,7 +380,6 @@ def calculate_kill_chance(
         result.verdict = "NO GO"
 
     # ── Combo suggestion ──────────────────────────────────────────────────────
-    combo = get_combo(my_state.get("champion", "_default"))
     result.combo_label = combo["combo_label"]
     result.spell_order = combo["spell_order"]
 
@@ -375,42 +391,39 @@ def calculate_kill_chance(
 
 # ── Formatting ─────────────────────────────────────────────────────────────────
 
+_VERDICT_ICONS = {"GO": "🟢", "RISKY": "🟡", "NO GO": "🔴"}
+
+
 def format_result(r: KillCalcResult) -> str:
     """Format result for overlay display."""
     if r.paused:
         return f"[ PAUSED ] {r.pause_reason}"
 
-    lines = []
-
-    # Header
-    verdict_icon = {"GO": "🟢", "RISKY": "🟡", "NO GO": "🔴"}.get(r.verdict, "⚪")
-    lines.append(
+    verdict_icon = _VERDICT_ICONS.get(r.verdict, "⚪")
+    active_line  = (f"Active items: +{r.active_item_damage:.0f} dmg\n"
+                    if r.active_item_damage > 0 else "")
+    text = (
+        # Header
         f"{verdict_icon} {r.verdict}  |  "
         f"Confidence: {r.confidence:.0%}  |  "
-        f"Kill ratio: {r.kill_ratio:.0%}"
+        f"Kill ratio: {r.kill_ratio:.0%}\n"
+        f"Target: {r.enemy_champion}  "
+        f"HP: {r.enemy_hp_percent:.0%} ({r.enemy_current_hp:.0f} / {r.enemy_max_hp:.0f})\n"
+        f"Effective HP (with shields): {r.enemy_effective_hp:.0f}\n"
+        "\n"
+        # Damage summary
+        f"Your burst:   {r.real_damage:.0f} dmg  "
+        f"(raw {r.raw_damage:.0f}  |  after resists {r.real_damage:.0f})\n"
+        f"Enemy armor:  {r.enemy_armor_used:.0f}   |  MR: {r.enemy_mr_used:.0f}\n"
+        f"{active_line}"
+        "\n"
+        # Combo
+        f"Combo:  {r.spell_order}\n"
     )
-    lines.append(f"Target: {r.enemy_champion}  "
-                 f"HP: {r.enemy_hp_percent:.0%} ({r.enemy_current_hp:.0f} / {r.enemy_max_hp:.0f})")
-    lines.append(f"Effective HP (with shields): {r.enemy_effective_hp:.0f}")
-    lines.append("")
-
-    # Damage summary
-    lines.append(f"Your burst:   {r.real_damage:.0f} dmg  "
-                 f"(raw {r.raw_damage:.0f}  |  after resists {r.real_damage:.0f})")
-    lines.append(f"Enemy armor:  {r.enemy_armor_used:.0f}   |  MR: {r.enemy_mr_used:.0f}")
-    if r.active_item_damage > 0:
-        lines.append(f"Active items: +{r.active_item_damage:.0f} dmg")
-    lines.append("")
-
-    # Combo
-    lines.append(f"Combo:  {r.spell_order}")
-    lines.append("")
 
     # Flags
     all_warnings = r.flags + r.summoner_warnings + r.item_flags
     if all_warnings:
-        lines.append("── Flags ──────────────────────")
-        for w in all_warnings:
-            lines.append(f"  {w}")
+        text += "\n── Flags ──────────────────────\n" + "\n".join(f"  {w}" for w in all_warnings)
 
-    return "\n".join(lines)
+    return text
@@ -6,24 +6,45 @@ No authentication required - local only.
 
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
 import logging
+import time
 from typing import Optional
 
+# orjson is optional — decodes the playerlist payload several times faster
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Suppress SSL warnings for self-signed Riot cert
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 BASE_URL = "https://127.0.0.1:2999/liveclientdata"
 TIMEOUT = 2.0  # seconds
 
+# gamestats response TTL (seconds). Snapshots are polled every ~0.3 s and
+# gameTime is only checked against second/minute thresholds, so one fetch
+# serves about three polls. activeplayer / playerlist are not cached: current
+# HP and stats feed the kill ratio and must be fresh on every poll.
+TTL_GAMESTATS = 1.0
+
 logger = logging.getLogger(__name__)
 
+# One keep-alive session for the process: the TCP socket and TLS session to
+# 127.0.0.1:2999 are reused across polls instead of a handshake per request
+_SESSION = requests.Session()
+_SESSION.verify = False
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4, pool_block=False))
+
 
 def _get(endpoint: str) -> Optional[dict | list]:
     """Raw GET request to Live Client API."""
     try:
-        r = requests.get(f"{BASE_URL}/{endpoint}", verify=False, timeout=TIMEOUT)
+        r = _SESSION.get(f"{BASE_URL}/{endpoint}", timeout=TIMEOUT)
         r.raise_for_status()
-        return r.json()
+        return orjson.loads(r.content) if ORJSON_AVAILABLE else r.json()
     except requests.exceptions.ConnectionError:
         logger.debug("Live Client API not available (game not running?)")
         return None
@@ -35,14 +56,44 @@ def _get(endpoint: str) -> Optional[dict | list]:
         return None
 
 
+_ttl_cache: dict = {}   # endpoint -> (response, monotonic fetch time)
+
+
+def _get_ttl(endpoint: str, ttl: float) -> Optional[dict | list]:
+    """_get() with the response reused for `ttl` seconds."""
+    now = time.monotonic()
+    value, fetched = _ttl_cache.get(endpoint, (None, None))
+    if fetched is not None and now - fetched < ttl:
+        return value
+    value = _get(endpoint)
+    _ttl_cache[endpoint] = (value, now)
+    return value
+
+
+# Team never changes within a game; remembered until gameTime runs backwards
+# (new game started)
+_team_memo: Optional[str] = None
+_last_game_time = 0.0
+
+
+def _track_session(game_time: float):
+    global _team_memo, _last_game_time
+    if game_time < _last_game_time:
+        _team_memo = None
+    _last_game_time = game_time
+
+
 def is_game_active() -> bool:
     """Check if a game is currently running."""
-    return _get("gamestats") is not None
+    return get_game_stats() is not None
 
 
 def get_game_stats() -> Optional[dict]:
     """Game time, map, mode."""
-    return _get("gamestats")
+    stats = _get_ttl("gamestats", TTL_GAMESTATS)
+    if stats:
+        _track_session(stats.get("gameTime", 0.0))
+    return stats
 
 
 def get_all_players() -> Optional[list]:
@@ -62,13 +113,17 @@ def get_events() -> Optional[dict]:
 
 # ── High-level helpers ────────────────────────────────────────────────────────
 
-def get_my_state() -> Optional[dict]:
+def get_my_state(player_data: Optional[dict] = None,
+                 all_players: Optional[list] = None) -> Optional[dict]:
     """
     Returns structured state for the local player.
     Includes: champion, level, AD, AP, spell ranks, items, HP, summoners.
+    Pass already-fetched activeplayer / playerlist data to skip the requests.
     """
-    player_data = get_active_player()
-    all_players = get_all_players()
+    if player_data is None:
+        player_data = get_active_player()
+    if all_players is None:
+        all_players = get_all_players()
 
     if not player_data or not all_players:
         return None
@@ -77,12 +132,9 @@ def get_my_state() -> Optional[dict]:
     stats = player_data.get("championStats", {})
     abilities = player_data.get("abilities", {})
 
-    # Find yourself in player list (summonerName match)
-    my_summoner = player_data.get("summonerName", "")
-    my_player_entry = next(
-        (p for p in all_players if p.get("summonerName") == my_summoner),
-        None
-    )
+    # Find yourself in player list (summonerName match) — one dict build, one lookup
+    by_name = {p.get("summonerName", ""): p for p in all_players}
+    my_player_entry = by_name.get(player_data.get("summonerName", ""))
 
     # Spell ranks (1-indexed from API)
     spell_ranks = {
@@ -105,14 +157,8 @@ def get_my_state() -> Optional[dict]:
         s2 = my_player_entry.get("summonerSpells", {}).get("summonerSpellTwo", {})
         summoners = [s1.get("rawDisplayName", ""), s2.get("rawDisplayName", "")]
 
-    # championName not in activeplayer API - get from playerlist by summonerName
-    my_summoner_name = player_data.get("summonerName", "")
-    champ_name = "Unknown"
-    if all_players and my_summoner_name:
-        for p in all_players:
-            if p.get("summonerName", "") == my_summoner_name:
-                champ_name = p.get("championName", "Unknown")
-                break
+    # championName not in activeplayer API - get from playerlist entry
+    champ_name = my_player_entry.get("championName", "Unknown") if my_player_entry else "Unknown"
 
     return {
         "champion":       champ_name,
@@ -135,12 +181,18 @@ def get_my_state() -> Optional[dict]:
     }
 
 
-def get_enemies_state(my_team: str = "ORDER") -> list[dict]:
+def get_enemies_state(my_team: str = "ORDER",
+                      all_players: Optional[list] = None) -> list[dict]:
     """
     Returns list of enemy player states.
     my_team: 'ORDER' (blue) or 'CHAOS' (red)
+    all_players: already-fetched playerlist (fetched here if omitted)
+
+    Every dict always carries champion / is_dead / hp_percent / hp_current /
+    hp_max_real, so callers can index them directly (None = HP unknown).
     """
-    all_players = get_all_players()
+    if all_players is None:
+        all_players = get_all_players()
     if not all_players:
         return []
 
@@ -165,25 +217,33 @@ def get_enemies_state(my_team: str = "ORDER") -> list[dict]:
                 s1.get("rawDisplayName", ""),
                 s2.get("rawDisplayName", ""),
             ],
-            # HP% will be filled in from screen reading
+            # HP will be filled in from screen reading / target panel
             "hp_percent":    None,
+            "hp_current":    None,
+            "hp_max_real":   None,
         })
 
     return result
 
 
-def get_my_team(active_player: Optional[dict] = None) -> str:
-    """Detect which team you're on (ORDER=blue, CHAOS=red)."""
+def get_my_team(active_player: Optional[dict] = None,
+                all_players: Optional[list] = None) -> str:
+    """Detect which team you're on (ORDER=blue, CHAOS=red). Memoized per game."""
+    global _team_memo
+    if _team_memo is not None:
+        return _team_memo
     if active_player is None:
         active_player = get_active_player()
-    all_players = get_all_players()
+    if all_players is None:
+        all_players = get_all_players()
     if not active_player or not all_players:
         return "ORDER"
 
     my_name = active_player.get("summonerName", "")
     for p in all_players:
         if p.get("summonerName") == my_name:
-            return p.get("team", "ORDER")
+            _team_memo = p.get("team", "ORDER")
+            return _team_memo
     return "ORDER"
 
 
@@ -195,6 +255,34 @@ def get_game_time() -> float:
     return 0.0
 
 
+def get_game_snapshot() -> dict:
+    """
+    Everything the main loop needs for one tick, as a plain picklable dict:
+      game_active — bool
+      my_state    — get_my_state() result or None
+      game_time   — seconds
+      my_team     — 'ORDER' | 'CHAOS'
+      enemies     — get_enemies_state() result ([] until my_state is known)
+    """
+    snap = {"game_active": False, "my_state": None, "game_time": 0.0,
+            "my_team": "ORDER", "enemies": []}
+    stats = get_game_stats()
+    if stats is None:
+        return snap
+
+    # Each endpoint is fetched once per snapshot and handed to the helpers
+    active_player = get_active_player()
+    all_players   = get_all_players()
+
+    snap["game_active"] = True
+    snap["my_state"]    = get_my_state(active_player, all_players)
+    snap["game_time"]   = stats.get("gameTime", 0.0)
+    if snap["my_state"]:
+        snap["my_team"] = get_my_team(active_player, all_players)
+        snap["enemies"] = get_enemies_state(snap["my_team"], all_players)
+    return snap
+
+
 # ── Demo / test ───────────────────────────────────────────────────────────────
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
@@ -0,0 +1,163 @@
+"""
+Live Client polling worker.
+
+Runs the Live Client API round-trips (HTTPS + JSON) in a child process and
+publishes the latest get_game_snapshot() through a shared-memory block,
+so the main loop reads game state without waiting on the network.
+
+Shared block layout (seqlock — no locks, writer never blocks):
+  [0:8)   seq      uint64, odd while the writer is mid-update
+  [8:12)  length   uint32, payload size in bytes
+  [12:16) paused   uint32, set by the main process — worker makes no requests
+  [16:)   payload  pickled snapshot dict (+ "ts" publish time)
+
+Reader copies seq → payload → seq and retries if the two seq values differ
+or are odd (torn read).
+"""
+
+import atexit
+import logging
+import multiprocessing as mp
+import pickle
+import struct
+import time
+from multiprocessing import shared_memory
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+POLL_HZ       = 1 / 0.3     # worker poll rate — main.py's POLL_INTERVAL tick
+PAUSED_CHECK  = 0.05        # seconds between pause-flag checks while idle
+SHM_SIZE      = 64 * 1024   # snapshot is a few KB; leaves plenty of headroom
+STALE_AFTER   = 5.0         # seconds — older snapshots are treated as missing
+READ_RETRIES  = 8
+READ_BACKOFF  = 0.001       # seconds between retries while a publish is in flight
+
+_SEQ    = struct.Struct("<Q")
+_LEN    = struct.Struct("<I")
+_PAUSED = struct.Struct("<I")
+_PAUSED_AT = _SEQ.size + _LEN.size
+_HEADER = _PAUSED_AT + _PAUSED.size
+
+
+def _publish(buf: memoryview, seq: int, payload: bytes) -> int:
+    """Write payload under the seqlock, return the new (even) sequence number."""
+    if len(payload) > len(buf) - _HEADER:
+        logger.warning(f"Live Client snapshot too large ({len(payload)} B) — dropped")
+        return seq
+    seq += 1                                     # odd → update in progress
+    _SEQ.pack_into(buf, 0, seq)
+    _LEN.pack_into(buf, _SEQ.size, len(payload))
+    buf[_HEADER:_HEADER + len(payload)] = payload
+    seq += 1                                     # even → consistent
+    _SEQ.pack_into(buf, 0, seq)
+    return seq
+
+
+def _worker_main(shm_name: str, interval: float):
+    """Child process entry: poll the Live Client and publish snapshots until killed."""
+    from modules.live_client import get_game_snapshot
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    seq = 0
+    next_tick = time.perf_counter()
+    try:
+        while True:
+            if _PAUSED.unpack_from(shm.buf, _PAUSED_AT)[0]:
+                time.sleep(PAUSED_CHECK)
+                next_tick = time.perf_counter()   # poll right away on resume
+                continue
+            try:
+                snap = get_game_snapshot()
+                snap["ts"] = time.time()
+                seq = _publish(shm.buf, seq, pickle.dumps(snap, pickle.HIGHEST_PROTOCOL))
+            except Exception as e:
+                logger.warning(f"Live Client worker error: {e}")
+
+            next_tick += interval
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_tick = time.perf_counter()
+    finally:
+        shm.close()
+
+
+class LiveClientChannel:
+    """Owns the shared block and the polling process; read() from the main loop."""
+
+    def __init__(self, poll_hz: float = POLL_HZ):
+        self._shm = shared_memory.SharedMemory(create=True, size=SHM_SIZE)
+        _SEQ.pack_into(self._shm.buf, 0, 0)      # seq 0 = nothing published yet
+        _PAUSED.pack_into(self._shm.buf, _PAUSED_AT, 1)   # idle until set_paused(False)
+        self._resumed_at = 0.0
+        self._pending    = False
+        self._proc = mp.Process(target=_worker_main,
+                                args=(self._shm.name, 1.0 / poll_hz),
+                                name="live-client-worker", daemon=True)
+        self._closed = False
+
+    def start(self):
+        self._proc.start()
+        atexit.register(self.close)
+
+    def set_paused(self, paused: bool):
+        """Stop / restart polling (e.g. while the calculator is toggled off)."""
+        if bool(_PAUSED.unpack_from(self._shm.buf, _PAUSED_AT)[0]) == paused:
+            return
+        _PAUSED.pack_into(self._shm.buf, _PAUSED_AT, int(paused))
+        if not paused:
+            self._resumed_at = time.time()
+
+    def read(self) -> Optional[dict]:
+        """
+        Latest snapshot (fresh objects every call — safe to mutate), or None
+        if there is nothing current to show. After a None, pending() tells
+        "not caught up yet" apart from "no worker / stale".
+        """
+        buf = self._shm.buf
+        self._pending = False
+        for attempt in range(READ_RETRIES):
+            if attempt:
+                time.sleep(READ_BACKOFF)
+            seq1 = _SEQ.unpack_from(buf, 0)[0]
+            if seq1 == 0:
+                self._pending = self._since_resume() < STALE_AFTER
+                return None
+            if seq1 & 1:
+                continue
+            length  = _LEN.unpack_from(buf, _SEQ.size)[0]
+            payload = bytes(buf[_HEADER:_HEADER + length])
+            if _SEQ.unpack_from(buf, 0)[0] != seq1:
+                continue
+            snap = pickle.loads(payload)
+            ts = snap.get("ts", 0.0)
+            if ts < self._resumed_at:
+                self._pending = self._since_resume() < STALE_AFTER
+                return None
+            if time.time() - ts > STALE_AFTER:
+                return None
+            return snap
+        self._pending = True      # writer kept the block busy — try next tick
+        return None
+
+    def pending(self) -> bool:
+        """True if the last read() returned None only because no fresh snapshot has landed yet."""
+        return self._pending
+
+    def _since_resume(self) -> float:
+        return time.time() - self._resumed_at
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        if self._proc.is_alive():
+            self._proc.terminate()
+            self._proc.join(timeout=1.0)
+        self._shm.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
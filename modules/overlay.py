@@ -4,10 +4,13 @@ Renders kill calculator output on top of the game.
 
 Uses tkinter (built-in Python) — no extra installs needed.
 Window is click-through on Windows via ctypes.
+
+No tk thread: the main loop owns the window and drives it with pump()
+once per tick. show()/hide() only record the wanted state, so they are
+safe to call from hotkey threads; pump() applies it.
 """
 
 import tkinter as tk
-import threading
 import logging
 from typing import Optional
 
@@ -26,6 +29,13 @@ FONT_MAIN      = ("Consolas", 11, "bold")
 FONT_SMALL     = ("Consolas", 10)
 FONT_VERDICT   = ("Consolas", 16, "bold")
 
+_VERDICT_COLORS = {
+    "GO":     COLOR_GO,
+    "RISKY":  COLOR_RISKY,
+    "NO GO":  COLOR_NOGO,
+    "PAUSED": COLOR_PAUSED,
+}
+
 # Window position (top-right, adjust as needed)
 WINDOW_X = 1380
 WINDOW_Y = 60
@@ -35,67 +45,61 @@ WINDOW_W = 520
 class KillOverlay:
     def __init__(self):
         self._root:   Optional[tk.Tk]   = None
-        self._thread: Optional[threading.Thread] = None
-        self._ready   = threading.Event()
-        self._lock    = threading.Lock()
-        self._pending_text: Optional[str] = None
-        self._pending_verdict: str = "NO GO"
-        self._visible = False
+        self._last_applied: Optional[tuple] = None   # (text, verdict) on screen
+        self._last_h  = 0                # window height last set via geometry()
+        self._shown_color: Optional[str] = None   # per-widget content on screen
+        self._shown_first: Optional[str] = None
+        self._shown_body:  Optional[str] = None
+        self._visible = False            # wanted state, applied by pump()
+        self._shown   = False            # actual window state
 
-    # ── Public API ─────────────────────────────────────────────────────────────
+    # ── Public API (update/pump/start: owning thread only) ─────────────────────
 
     def start(self):
-        """Start overlay in background thread."""
-        if self._thread and self._thread.is_alive():
+        """Create the window in the calling thread, which must also call pump()."""
+        if self._root:
             return
-        self._thread = threading.Thread(target=self._run_tk, daemon=True)
-        self._thread.start()
-        self._ready.wait(timeout=3.0)
+        try:
+            self._root = tk.Tk()
+            self._setup_window()
+            self._setup_widgets()
+            self._make_click_through()
+        except Exception as e:
+            logger.error(f"Overlay error: {e}")
+            self._root = None
 
     def stop(self):
-        """Hide overlay (don't destroy — reuse on next start)."""
+        """Hide overlay (don't destroy — reuse on next show)."""
         self._visible = False
-        if self._root:
-            try:
-                self._root.after(0, self._root.withdraw)
-            except Exception:
-                pass
 
     def update(self, text: str, verdict: str = "NO GO"):
-        """Thread-safe update of overlay content."""
-        with self._lock:
-            self._pending_text    = text
-            self._pending_verdict = verdict
+        """Apply new overlay content; drawn on the next pump()."""
         if self._root:
-            try:
-                self._root.after(0, self._apply_update)
-            except Exception:
-                pass
+            self._apply_update(text, verdict)
 
     def show(self):
-        if self._root:
-            try:
-                self._root.after(0, self._root.deiconify)
-                self._visible = True
-            except Exception:
-                pass
+        self._visible = True
 
     def hide(self):
         self.stop()
 
-    # ── Internal tk thread ─────────────────────────────────────────────────────
-
-    def _run_tk(self):
+    def pump(self):
+        """Apply the wanted visibility and process pending tk events."""
+        if not self._root:
+            return
         try:
-            self._root = tk.Tk()
-            self._setup_window()
-            self._setup_widgets()
-            self._make_click_through()
-            self._ready.set()
-            self._root.mainloop()
-        except Exception as e:
+            if self._visible != self._shown:
+                if self._visible:
+                    self._root.deiconify()
+                else:
+                    self._root.withdraw()
+                self._shown = self._visible
+            self._root.update()
+        except tk.TclError as e:
             logger.error(f"Overlay error: {e}")
-            self._ready.set()
+            self._root = None
+
+    # ── Internal ───────────────────────────────────────────────────────────────
 
     def _setup_window(self):
         r = self._root
@@ -142,41 +146,45 @@ class KillOverlay:
             font=("Consolas", 9), bg=BG_COLOR, fg="#555555")
         footer.pack(anchor="e")
 
-    def _apply_update(self):
-        with self._lock:
-            text    = self._pending_text
-            verdict = self._pending_verdict
-
-        if text is None:
+    def _apply_update(self, text: str, verdict: str):
+        if (text, verdict) == self._last_applied:
             return
-
-        verdict_color = {
-            "GO":     COLOR_GO,
-            "RISKY":  COLOR_RISKY,
-            "NO GO":  COLOR_NOGO,
-            "PAUSED": COLOR_PAUSED,
-        }.get(verdict, COLOR_PAUSED)
-
-        # Extract first line as verdict line, rest as body
-        lines = text.split("\n")
-        first = lines[0] if lines else ""
-        body  = "\n".join(lines[1:]) if len(lines) > 1 else ""
-
-        self._border_frame.configure(bg=verdict_color)
-        self._verdict_label.configure(text=first, fg=verdict_color)
+        self._last_applied = (text, verdict)
+
+        verdict_color = _VERDICT_COLORS.get(verdict, COLOR_PAUSED)
+
+        # First line is the verdict line, the rest is the body
+        first, _, body = text.partition("\n")
+
+        # Touch only the widgets whose content changed; Label.configure
+        # schedules a redraw even when the value is identical
+        if verdict_color != self._shown_color:
+            self._border_frame.configure(bg=verdict_color)
+            self._verdict_label.configure(fg=verdict_color)
+            self._shown_color = verdict_color
+        if first != self._shown_first:
+            self._verdict_label.configure(text=first)
+            self._shown_first = first
+        if body == self._shown_body:
+            return                        # verdict line is fixed height
         self._text_label.configure(text=body)
+        self._shown_body = body
 
-        # Resize window height to fit content
+        # Resize window height to fit content — only when it actually changed
         self._root.update_idletasks()
         req_h = self._root.winfo_reqheight()
-        self._root.geometry(f"{WINDOW_W}x{req_h}+{WINDOW_X}+{WINDOW_Y}")
+        if req_h != self._last_h:
+            self._root.geometry(f"{WINDOW_W}x{req_h}+{WINDOW_X}+{WINDOW_Y}")
+            self._last_h = req_h
 
     def _make_click_through(self):
         """Make window click-through on Windows so it doesn't block game input."""
         try:
             import ctypes
             self._root.update_idletasks()
-            hwnd = ctypes.windll.user32.FindWindowW(None, "LoL Kill Calc")
+            # Top-level HWND straight from our own widget (GA_ROOT = 2) —
+            # no title search over every window on the desktop
+            hwnd = ctypes.windll.user32.GetAncestor(int(self._root.winfo_id()), 2)
             if hwnd:
                 style = ctypes.windll.user32.GetWindowLongW(hwnd, -20)
                 ctypes.windll.user32.SetWindowLongW(hwnd, -20, style | 0x80000 | 0x20)
@@ -189,8 +197,8 @@ class KillOverlay:
 _overlay: Optional[KillOverlay] = None
 
 def get_overlay() -> KillOverlay:
+    """Shared overlay instance; the thread that drives it must call start() first."""
     global _overlay
     if _overlay is None:
         _overlay = KillOverlay()
-        _overlay.start()
     return _overlay
@@ -13,6 +13,7 @@ We read the WIDTH ratio of that bar to determine HP%.
 import numpy as np
 import logging
 from typing import Optional
+import threading
 import time
 
 logger = logging.getLogger(__name__)
@@ -26,6 +27,21 @@ except ImportError:
     LIBS_AVAILABLE = False
     logger.warning("mss or cv2 not installed. Screen reading disabled.")
 
+# bettercam is optional (Windows) — DXGI desktop duplication with its own
+# capture thread; the strip is then read from its ring buffer instead of mss
+try:
+    import bettercam
+    BETTERCAM_AVAILABLE = True
+except ImportError:
+    BETTERCAM_AVAILABLE = False
+
+# Numba is optional — fuses the HP bar scan into one compiled pass
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 
 # ── Region configuration ───────────────────────────────────────────────────────
 # Calibrated for 2560x1440 with Blitz.gg overlay.
@@ -37,6 +53,15 @@ except ImportError:
 
 USE_BLITZ_LAYOUT = True
 
+# Prefetched mss frames older than max(FRAME_MAX_AGE, 4 × grab time) are
+# dropped for a synchronous grab; prefetches aim to land PREFETCH_LEAD early
+FRAME_MAX_AGE = 0.02
+PREFETCH_LEAD = 0.005
+
+# bettercam frame rate — just above main.py's ~300 ms tick, the only consumer.
+# The mss thread has no rate: it grabs once per read (see _capture_loop).
+CAPTURE_FPS = 4
+
 BASE_WIDTH  = 2560
 BASE_HEIGHT = 1440
 
@@ -69,6 +94,98 @@ HP_COLOR_YELLOW = ([20,  100, 100], [39,  255, 255])
 HP_COLOR_RED    = ([0,   150, 100], [10,  255, 255])
 HP_COLOR_RED2   = ([170, 150, 100], [180, 255, 255])  # red wraps in HSV
 
+# Same ranges as uint8 (lo, hi) bound arrays, built once
+_HP_RANGES = tuple(
+    (np.array(lo, dtype=np.uint8), np.array(hi, dtype=np.uint8))
+    for lo, hi in (HP_COLOR_GREEN, HP_COLOR_YELLOW, HP_COLOR_RED, HP_COLOR_RED2)
+)
+_HP_BOUNDS = np.array(_HP_RANGES, dtype=np.int32)   # (range, lo/hi, channel)
+_HP_V_MIN  = int(_HP_BOUNDS[:, 0, 2].min())          # darkest V any HP range accepts
+
+# OpenCV's fixed-point 8-bit BGR→HSV tables (color_hsv: hsv_shift = 12), so
+# the compiled scan below classifies every pixel exactly like cvtColor + inRange
+_HSV_SHIFT = 12
+
+
+def _hsv_tables() -> tuple[np.ndarray, np.ndarray]:
+    i = np.arange(1, 256, dtype=np.float64)
+    sdiv = np.zeros(256, dtype=np.int32)
+    hdiv = np.zeros(256, dtype=np.int32)
+    sdiv[1:] = np.rint((255 << _HSV_SHIFT) / i)
+    hdiv[1:] = np.rint((180 << _HSV_SHIFT) / (6.0 * i))
+    return sdiv, hdiv
+
+
+_SDIV_TABLE, _HDIV_TABLE = _hsv_tables()
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, boundscheck=False)
+    def _rightmost_hp_col(bgr, bounds, sdiv, hdiv):
+        """
+        1 + index of the rightmost column holding any HP-colored pixel, 0 if
+        none. BGR→HSV and the range tests are done per pixel, scanning from
+        the right so a full bar exits on its first column.
+        """
+        half = 1 << (_HSV_SHIFT - 1)
+        # Lowest V / S any range accepts: dark background pixels fail on V
+        # and grey UI on S before the hue (the costly part) is computed
+        v_lo = bounds[0, 0, 2]
+        s_lo = bounds[0, 0, 1]
+        for k in range(1, bounds.shape[0]):
+            v_lo = min(v_lo, bounds[k, 0, 2])
+            s_lo = min(s_lo, bounds[k, 0, 1])
+        for x in range(bgr.shape[1] - 1, -1, -1):
+            for y in range(bgr.shape[0]):
+                b = np.int32(bgr[y, x, 0])
+                g = np.int32(bgr[y, x, 1])
+                r = np.int32(bgr[y, x, 2])
+                v = max(b, max(g, r))
+                if v < v_lo:
+                    continue
+                diff = v - min(b, min(g, r))
+                s = (diff * sdiv[v] + half) >> _HSV_SHIFT
+                if s < s_lo:
+                    continue
+                if v == r:
+                    h = g - b
+                elif v == g:
+                    h = b - r + 2 * diff
+                else:
+                    h = r - g + 4 * diff
+                h = (h * hdiv[diff] + half) >> _HSV_SHIFT
+                if h < 0:
+                    h += 180
+                for k in range(bounds.shape[0]):
+                    if (bounds[k, 0, 0] <= h <= bounds[k, 1, 0]
+                            and bounds[k, 0, 1] <= s <= bounds[k, 1, 1]
+                            and bounds[k, 0, 2] <= v <= bounds[k, 1, 2]):
+                        return x + 1
+        return 0
+
+    @njit(cache=True, boundscheck=False)
+    def _bar_ratios(bgr, slices, bounds, sdiv, hdiv):
+        """
+        HP ratio for every (y1, y2, x1, x2) bar slice of the capture strip —
+        the whole per-bar loop of read_enemy_hp_percents in one call.
+        """
+        out = np.empty(slices.shape[0], dtype=np.float64)
+        for i in range(slices.shape[0]):
+            bar = bgr[slices[i, 0]:slices[i, 1], slices[i, 2]:slices[i, 3]]
+            if bar.size == 0:
+                out[i] = 1.0
+            else:
+                out[i] = min(1.0, _rightmost_hp_col(bar, bounds, sdiv, hdiv) / bar.shape[1])
+        return out
+
+    # Compile (or load from cache) now so the first frame isn't stalled —
+    # both for whole frames and for bar crops (non-contiguous views)
+    for _img in (np.zeros((9, 69, 3), dtype=np.uint8),
+                 np.zeros((30, 100, 3), dtype=np.uint8)[:9, :69]):
+        _rightmost_hp_col(_img, _HP_BOUNDS, _SDIV_TABLE, _HDIV_TABLE)
+        _bar_ratios(_img, np.array([[0, 9, 0, 69]], dtype=np.int32),
+                    _HP_BOUNDS, _SDIV_TABLE, _HDIV_TABLE)
+
 
 def _scale_region(region: tuple, screen_w: int, screen_h: int) -> tuple:
     """Scale regions to actual screen resolution."""
@@ -78,42 +195,135 @@ def _scale_region(region: tuple, screen_w: int, screen_h: int) -> tuple:
     return (int(x * sx), int(y * sy), max(1, int(w * sx)), max(1, int(h * sy)))
 
 
-def _detect_hp_ratio(bar_image: np.ndarray) -> float:
+def _shot_to_bgr(shot, dst: Optional[np.ndarray] = None) -> np.ndarray:
     """
-    Given a cropped HP bar image, return HP ratio 0.0–1.0.
-    Strategy: find the rightmost pixel that is green/yellow/red (HP color).
-    The ratio = rightmost_hp_pixel / bar_total_width.
+    mss screenshot → BGR image, converted straight out of the raw BGRA buffer
+    (no np.array copy). Writes into dst when it matches the shot size.
     """
-    if bar_image is None or bar_image.size == 0:
-        return 1.0  # assume full HP if can't read
+    bgra = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+    if dst is not None and dst.shape[:2] == bgra.shape[:2]:
+        return cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR, dst=dst)
+    return cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR)
 
-    hsv = cv2.cvtColor(bar_image, cv2.COLOR_BGR2HSV)
-    bar_w = bar_image.shape[1]
 
-    # Combine masks for all HP colors
-    mask_green  = cv2.inRange(hsv,
-        np.array(HP_COLOR_GREEN[0]),  np.array(HP_COLOR_GREEN[1]))
-    mask_yellow = cv2.inRange(hsv,
-        np.array(HP_COLOR_YELLOW[0]), np.array(HP_COLOR_YELLOW[1]))
-    mask_red1   = cv2.inRange(hsv,
-        np.array(HP_COLOR_RED[0]),    np.array(HP_COLOR_RED[1]))
-    mask_red2   = cv2.inRange(hsv,
-        np.array(HP_COLOR_RED2[0]),   np.array(HP_COLOR_RED2[1]))
+def _shot_bgr_view(shot, dst: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    mss screenshot → BGR view of its raw BGRA buffer: the alpha byte is
+    skipped by stride instead of a BGRA→BGR pass. When dst (H×W×4) is given
+    the raw bytes are copied into it, so the frame outlives the shot.
+    """
+    bgra = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+    if dst is not None and dst.shape == bgra.shape:
+        np.copyto(dst, bgra)
+        bgra = dst
+    return bgra[:, :, :3]
+
 
-    combined = cv2.bitwise_or(mask_green, mask_yellow)
-    combined = cv2.bitwise_or(combined, mask_red1)
-    combined = cv2.bitwise_or(combined, mask_red2)
+def _hp_mask(image: np.ndarray, scratch: Optional[tuple] = None) -> np.ndarray:
+    """
+    255 where a pixel is green/yellow/red (HP color), else 0.
 
-    # Collapse rows → 1D column presence
-    col_presence = np.any(combined > 0, axis=0)
-    hp_cols = np.where(col_presence)[0]
+    scratch: optional (hsv, mask, combined, rows) buffers at least as large as
+             the image (rows: 2×W, for _hp_columns), reused instead of
+             allocating an image per OpenCV call.
+    """
+    img_h, img_w = image.shape[:2]
+    if scratch is not None and scratch[0].shape[0] >= img_h and scratch[0].shape[1] >= img_w:
+        hsv_buf  = scratch[0][:img_h, :img_w]
+        mask     = scratch[1][:img_h, :img_w]
+        combined = scratch[2][:img_h, :img_w]
+    else:
+        hsv_buf = mask = combined = None
+
+    hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV, dst=hsv_buf)
+
+    # First range straight into `combined`, the rest OR'd in place
+    (lo, hi), *rest = _HP_RANGES
+    combined = cv2.inRange(hsv, lo, hi, dst=combined)
+    for lo, hi in rest:
+        mask = cv2.inRange(hsv, lo, hi, dst=mask)
+        combined = cv2.bitwise_or(combined, mask, dst=combined)
+    return combined
+
+
+def _hp_columns(image: np.ndarray, scratch: Optional[tuple] = None) -> np.ndarray:
+    """
+    Per column: nonzero if any pixel in it is HP-colored, else 0.
+    Each range mask is max-reduced to one row right away, so the ORs run
+    over W bytes instead of H×W. scratch: as for _hp_mask.
+    """
+    img_h, img_w = image.shape[:2]
+    if scratch is not None and scratch[0].shape[0] >= img_h and scratch[0].shape[1] >= img_w:
+        hsv_buf = scratch[0][:img_h, :img_w]
+        mask    = scratch[1][:img_h, :img_w]
+        acc     = scratch[3][0:1, :img_w]
+        row     = scratch[3][1:2, :img_w]
+    else:
+        hsv_buf = mask = acc = row = None
+
+    hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV, dst=hsv_buf)
+
+    (lo, hi), *rest = _HP_RANGES
+    mask = cv2.inRange(hsv, lo, hi, dst=mask)
+    acc  = cv2.reduce(mask, 0, cv2.REDUCE_MAX, dst=acc)
+    for lo, hi in rest:
+        mask = cv2.inRange(hsv, lo, hi, dst=mask)
+        row  = cv2.reduce(mask, 0, cv2.REDUCE_MAX, dst=row)
+        acc  = cv2.bitwise_or(acc, row, dst=acc)
+    return acc[0]
+
+
+def _rightmost_nonzero(row: np.ndarray) -> int:
+    """Index of the last nonzero entry of a 1-D 0/255 row, -1 if none."""
+    # argmax of the reversed view: one pass, no index array allocated
+    rev = row[::-1]
+    k = int(rev.argmax())
+    return -1 if rev[k] == 0 else row.size - 1 - k
+
+
+def _cols_ratio(cols: np.ndarray) -> float:
+    """HP ratio of one bar from its slice of an _hp_columns() result."""
+    if cols.size == 0:
+        return 1.0  # assume full HP if can't read
 
-    if len(hp_cols) == 0:
+    x = _rightmost_nonzero(cols)
+    if x < 0:
         return 0.0  # bar appears empty
 
-    rightmost = int(hp_cols.max())
-    ratio = (rightmost + 1) / bar_w
-    return min(1.0, max(0.0, ratio))
+    bar_w = cols.size
+    return min(1.0, max(0.0, (x + 1) / bar_w))
+
+
+def _gathered_ratios(bar_cols: np.ndarray) -> list[float]:
+    """_cols_ratio for every row of a (bars, w) column array, in one vectorized pass."""
+    rev  = bar_cols[:, ::-1]
+    k    = rev.argmax(axis=1)
+    hit  = rev[np.arange(len(k)), k] != 0
+    w    = bar_cols.shape[1]
+    return np.where(hit, np.minimum(1.0, (w - k) / w), 0.0).tolist()
+
+
+def _mask_ratio(bar_mask: np.ndarray) -> float:
+    """HP ratio of one bar from its slice of an _hp_mask() result."""
+    if bar_mask.size == 0:
+        return 1.0  # assume full HP if can't read
+    # OR the rows together (one pass, no bool temporaries)
+    return _cols_ratio(np.bitwise_or.reduce(bar_mask, axis=0))
+
+
+def _detect_hp_ratio(bar_image: np.ndarray, scratch: Optional[tuple] = None) -> float:
+    """
+    Given a cropped HP bar image, return HP ratio 0.0–1.0.
+    Strategy: find the rightmost pixel that is green/yellow/red (HP color).
+    The ratio = rightmost_hp_pixel / bar_total_width.
+    """
+    if bar_image is None or bar_image.size == 0:
+        return 1.0  # assume full HP if can't read
+
+    if NUMBA_AVAILABLE:
+        cols = _rightmost_hp_col(bar_image, _HP_BOUNDS, _SDIV_TABLE, _HDIV_TABLE)
+        return min(1.0, cols / bar_image.shape[1])
+    return _cols_ratio(_hp_columns(bar_image, scratch))
 
 
 class ScreenReader:
@@ -123,10 +333,140 @@ class ScreenReader:
         self._screen_w = BASE_WIDTH
         self._screen_h = BASE_HEIGHT
         self._scaled_bars = _ENEMY_HP_BARS_1080P.copy()
+        self._cap_region: dict = {}
+        self._bar_slices = np.zeros((0, 4), dtype=np.int32)   # (y1, y2, x1, x2) per bar
+        self._bar_box = (0, 0, 0, 0)                          # (y1, y2, x1, x2) around all bars
+        self._scratch: dict[str, np.ndarray] = {}        # per-caller BGR buffers
+        self._mask_scratch: Optional[tuple] = None       # (hsv, mask, combined, rows), strip-sized
+        self._bars_share_rows = False                     # every bar spans _bar_box's rows
+        self._bar_cols: Optional[np.ndarray] = None      # (bars, w) gather index, equal widths
+        self._cam = None                                  # bettercam camera, if running
+        # mss capture thread: ring of 3 BGRA strip buffers, so the writer never
+        # waits on (or overwrites) the slot the reader is analysing
+        self._ring: list[np.ndarray] = []
+        self._ring_lock = threading.Lock()
+        self._ready   = -1                # last fully written slot
+        self._reading = -1                # slot claimed by read_enemy_hp_percents
+        self._ready_at = 0.0              # perf_counter when the ready slot was grabbed
+        # One grab per read, timed to land just before the next read is due
+        self._want_frame   = threading.Event()   # set after each read
+        self._capture_on   = threading.Event()   # cleared by pause_capture()
+        self._capture_stop = threading.Event()   # set by stop_capture()
+        self._capture_on.set()
+        self._last_read   = 0.0           # perf_counter of the previous read
+        self._read_period = 0.0           # smoothed gap between reads (0 = unknown)
+        self._grab_time   = 0.0           # duration of the last grab
 
         if self.available:
             self._sct = mss.mss()
             self._detect_resolution()
+            self._start_camera()
+            if self._cam is None:
+                threading.Thread(target=self._capture_loop, daemon=True,
+                                 name="hp-capture").start()
+
+    def _start_camera(self):
+        """Stream the HP-bar strip via bettercam when installed (BGR, no BGRA→BGR step)."""
+        if not BETTERCAM_AVAILABLE:
+            return
+        r = self._cap_region
+        try:
+            cam = bettercam.create(
+                output_color="BGR",
+                region=(r["left"], r["top"], r["left"] + r["width"], r["top"] + r["height"]))
+            cam.start(target_fps=CAPTURE_FPS, video_mode=True)
+            self._cam = cam
+        except Exception as e:
+            logger.warning(f"bettercam unavailable, using mss: {e}")
+
+    def _capture_loop(self):
+        """
+        Prefetch the HP-bar strip into the ring (daemon thread). Idle until a
+        read asks for the next frame, then grab it just before that read is
+        due, so the capture rate follows the consumer and stops with it.
+        """
+        sct    = mss.mss()                # mss handles are per-thread
+        region = self._cap_region
+        while True:
+            self._want_frame.wait()
+            self._want_frame.clear()
+            if self._capture_stop.is_set():
+                break
+            if not self._read_period:     # read cadence not known yet
+                continue
+            due = (self._last_read + self._read_period
+                   - 1.5 * self._grab_time - PREFETCH_LEAD)
+            if self._capture_stop.wait(max(0.0, due - time.perf_counter())):
+                break
+            if not self._capture_on.is_set():
+                continue
+            with self._ring_lock:
+                slot = next(i for i in range(len(self._ring))
+                            if i != self._ready and i != self._reading)
+            try:
+                started = time.perf_counter()
+                _shot_bgr_view(sct.grab(region), self._ring[slot])
+                self._grab_time = time.perf_counter() - started
+                with self._ring_lock:
+                    self._ready    = slot
+                    self._ready_at = time.perf_counter()
+            except Exception as e:
+                logger.debug(f"HP strip capture failed: {e}")
+
+    def _claim_frame(self) -> Optional[np.ndarray]:
+        """
+        Latest prefetched strip, held until _release_frame(); None if there
+        is none yet or it is older than max(FRAME_MAX_AGE, 4 × grab time).
+        """
+        now = time.perf_counter()
+        if self._last_read:
+            gap = now - self._last_read
+            if not self._read_period:
+                self._read_period = gap
+            elif gap <= 2 * self._read_period:    # a pause isn't a cadence
+                self._read_period = 0.8 * self._read_period + 0.2 * gap
+        self._last_read = now
+        max_age = max(FRAME_MAX_AGE, 4 * self._grab_time)
+        with self._ring_lock:
+            if self._ready < 0 or now - self._ready_at > max_age:
+                return None
+            self._reading = self._ready
+            return self._ring[self._reading][:, :, :3]
+
+    def _release_frame(self):
+        with self._ring_lock:
+            self._reading = -1
+        self._want_frame.set()            # prefetch for the next read
+
+    def pause_capture(self):
+        """Stop background capture until resume_capture() (calculator off)."""
+        if not self._capture_on.is_set():
+            return
+        self._capture_on.clear()
+        if self._cam:
+            try:
+                self._cam.stop()
+            except Exception as e:
+                logger.warning(f"bettercam stop failed: {e}")
+
+    def resume_capture(self):
+        if self._capture_on.is_set() or self._capture_stop.is_set():
+            return
+        self._capture_on.set()
+        self._last_read   = 0.0           # re-learn the cadence after a pause
+        self._read_period = 0.0
+        if self._cam:
+            try:
+                self._cam.start(target_fps=CAPTURE_FPS, video_mode=True)
+            except Exception as e:
+                logger.warning(f"bettercam restart failed, using mss: {e}")
+                self._cam = None
+
+    def stop_capture(self):
+        """End background capture for good (quit)."""
+        self.pause_capture()
+        self._capture_stop.set()
+        self._want_frame.set()            # wake the thread so it can exit
 
     def _detect_resolution(self):
         if not self.available:
@@ -138,48 +478,95 @@ class ScreenReader:
             _scale_region(r, self._screen_w, self._screen_h)
             for r in _ENEMY_HP_BARS_1080P
         ]
+        if USE_BLITZ_LAYOUT:
+            cap_left, cap_top = 1050, 487
+            cap_w = self._screen_w - 1050
+            cap_h = 30
+        else:
+            cap_left, cap_top = 0, 0
+            cap_w = self._screen_w
+            cap_h = 60
+        self._cap_region = {"top": cap_top, "left": cap_left,
+                            "width": cap_w, "height": cap_h}
+        # Each bar as a slice of the strip, clipped once here instead of per frame
+        self._bar_slices = np.array(
+            [(max(0, y - cap_top), min(cap_h, y - cap_top + h),
+              max(0, x - cap_left), min(cap_w, x - cap_left + w))
+             for (x, y, w, h) in self._scaled_bars],
+            dtype=np.int32)
+        b = self._bar_slices
+        self._bar_box = (int(b[:, 0].min()), int(b[:, 1].max()),
+                         int(b[:, 2].min()), int(b[:, 3].max()))
+        self._bars_share_rows = bool((b[:, 0] == b[0, 0]).all() and (b[:, 1] == b[0, 1]).all())
+        # Same-size bars: gather all of them out of the box's column row at once
+        widths = b[:, 3] - b[:, 2]
+        self._bar_cols = None
+        if self._bars_share_rows and (widths == widths[0]).all() and widths[0] > 0:
+            self._bar_cols = ((b[:, 2:3] - self._bar_box[2])
+                              + np.arange(widths[0])).astype(np.intp)
+        self._ring = [np.empty((cap_h, cap_w, 4), dtype=np.uint8) for _ in range(3)]
+        # HSV/mask/row buffers for the whole capture strip (see _hp_mask, _hp_columns)
+        self._mask_scratch = (np.empty((cap_h, cap_w, 3), dtype=np.uint8),
+                              np.empty((cap_h, cap_w), dtype=np.uint8),
+                              np.empty((cap_h, cap_w), dtype=np.uint8),
+                              np.empty((2, cap_w), dtype=np.uint8))
         logger.info(f"Screen resolution: {self._screen_w}x{self._screen_h}")
 
+    def scratch(self, name: str, height: int, width: int, channels: int = 3) -> np.ndarray:
+        """uint8 buffer reused across calls for a fixed-size region (BGR by default)."""
+        shape = (height, width, channels) if channels > 1 else (height, width)
+        buf = self._scratch.get(name)
+        if buf is None or buf.shape != shape:
+            buf = self._scratch[name] = np.empty(shape, dtype=np.uint8)
+        return buf
+
     def read_enemy_hp_percents(self) -> list[float]:
         """
         Returns list of 5 HP% values for enemy team (top panel, left to right).
         Values: 0.0 = dead, 1.0 = full HP.
-        Falls back to [1.0] * 5 if screen reading fails.
+        Falls back to [1.0] * 5 if screen reading fails or the bars are
+        hidden (whole bar area too dark to hold any HP color).
         """
         if not self.available:
             return [1.0] * 5
 
         try:
-            if USE_BLITZ_LAYOUT:
-                cap_left, cap_top = 1050, 487
-                cap_w = self._screen_w - 1050
-                cap_h = 30
+            if self._cam and self._capture_on.is_set():
+                frame = self._cam.get_latest_frame()
             else:
-                cap_left, cap_top = 0, 0
-                cap_w = self._screen_w
-                cap_h = 60
-
-            region = {"top": cap_top, "left": cap_left,
-                      "width": cap_w, "height": cap_h}
-            screenshot = self._sct.grab(region)
-            frame = np.array(screenshot)
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
-
-            hp_values = []
-            for (x, y, w, h) in self._scaled_bars:
-                rx = x - cap_left
-                ry = y - cap_top
-                y1, y2 = max(0, ry), min(frame.shape[0], ry + h)
-                x1, x2 = max(0, rx), min(frame.shape[1], rx + w)
-                bar_crop = frame[y1:y2, x1:x2]
-                ratio = _detect_hp_ratio(bar_crop)
-                hp_values.append(ratio)
-
-            return hp_values
+                frame = self._claim_frame()
+            if frame is None:             # no frame published yet
+                frame = _shot_bgr_view(self._sct.grab(self._cap_region))
+
+            # Scoreboard covered (shop, death recap…): no pixel is bright
+            # enough for any HP range — unreadable, not five dead enemies
+            by1, by2, bx1, bx2 = self._bar_box
+            box = frame[by1:by2, bx1:bx2]
+            if box.size == 0 or box.max() < _HP_V_MIN:
+                return [1.0] * 5
+
+            if NUMBA_AVAILABLE:
+                return _bar_ratios(frame, self._bar_slices, _HP_BOUNDS,
+                                   _SDIV_TABLE, _HDIV_TABLE).tolist()
+
+            # Without Numba: one cvtColor + inRange pass over just the box
+            # around the bars, then each bar is a slice of that mask — or,
+            # when the bars sit on the same rows, of its column-reduced row
+            if self._bars_share_rows:
+                cols = _hp_columns(box, self._mask_scratch)
+                if self._bar_cols is not None:
+                    return _gathered_ratios(cols[self._bar_cols])
+                return [_cols_ratio(cols[x1 - bx1:x2 - bx1])
+                        for _, _, x1, x2 in self._bar_slices.tolist()]
+            mask = _hp_mask(box, self._mask_scratch)
+            return [_mask_ratio(mask[y1 - by1:y2 - by1, x1 - bx1:x2 - bx1])
+                    for y1, y2, x1, x2 in self._bar_slices.tolist()]
 
         except Exception as e:
             logger.warning(f"Screen read failed: {e}")
             return [1.0] * 5
+        finally:
+            self._release_frame()
 
     def calibrate_interactive(self):
         """
@@ -191,9 +578,7 @@ class ScreenReader:
             return
 
         fname = "calibration_screenshot.png"
-        screenshot = self._sct.grab(self._sct.monitors[1])
-        frame = np.array(screenshot)
-        frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+        frame = _shot_to_bgr(self._sct.grab(self._sct.monitors[1]))
 
         # Draw current bar regions
         for i, (x, y, w, h) in enumerate(self._scaled_bars):
@@ -252,9 +637,7 @@ def read_clicked_target_hp() -> float:
     try:
         sct = reader._sct
         region = {"top": 15, "left": 85, "width": 215, "height": 20}
-        shot = sct.grab(region)
-        frame = np.array(shot)
-        frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+        frame = _shot_to_bgr(sct.grab(region), reader.scratch("target_hp", 20, 215))
 
         ratio = _detect_hp_ratio(frame)
         # Sanity check — if ratio is exactly 1.0 panel may not be visible
@@ -296,19 +679,21 @@ def read_clicked_target_name() -> str | None:
         sct = reader._sct
         # Capture top-left panel name area — above the HP bar
         region = {"top": 2, "left": 85, "width": 220, "height": 20}
-        shot = sct.grab(region)
-        frame = np.array(shot)
-        frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+        frame = _shot_to_bgr(sct.grab(region), reader.scratch("target_name", 20, 220))
 
         # Upscale for better OCR accuracy
-        frame = cv2.resize(frame, (frame.shape[1] * 3, frame.shape[0] * 3),
-                           interpolation=cv2.INTER_CUBIC)
+        h, w = 20 * 3, 220 * 3
+        frame = cv2.resize(frame, (w, h), dst=reader.scratch("target_name_big", h, w),
+                           interpolation=cv2.INTER_LINEAR)
 
         # Convert to grayscale and threshold (white text on dark bg)
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        _, thresh = cv2.threshold(gray, 140, 255, cv2.THRESH_BINARY)
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY,
+                            dst=reader.scratch("target_name_gray", h, w, 1))
+        _, thresh = cv2.threshold(gray, 140, 255, cv2.THRESH_BINARY,
+                                  dst=reader.scratch("target_name_thresh", h, w, 1))
 
-        img = Image.fromarray(thresh)
+        # Wrap the contiguous threshold bytes directly (fromarray would copy)
+        img = Image.frombuffer("L", (w, h), thresh, "raw", "L", 0, 1)
         raw = pytesseract.image_to_string(
             img,
             config="--psm 7 --oem 3 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz' "
@@ -6,7 +6,9 @@ Coordinates calibrated for 2560x1440.
 """
 
 import logging
+import os
 import re
+import zlib
 import numpy as np
 import cv2
 
@@ -51,12 +53,62 @@ except ImportError:
     logger.warning("pytesseract/PIL not installed — target panel reading disabled")
 
 
+# ── Digit glyphs ──────────────────────────────────────────────────────────────
+# The panel numbers use one fixed bitmap font, so each glyph is matched against
+# stored templates instead of running Tesseract. Templates are captured in-game
+# by calibrate_digit_glyphs(); until all of "0-9/" exist, Tesseract is used.
+_GLYPH_CHARS     = "0123456789/"
+_GLYPH_SIZE      = (8, 12)       # (w, h) every glyph is normalized to
+_GLYPH_MIN_AREA  = 3             # smaller components are noise
+_GLYPH_MIN_SCORE = 0.90          # cosine similarity; below this → Tesseract
+_GLYPHS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            "data", "panel_digits.npz")
+
+
+def _load_glyphs() -> tuple:
+    """(labels, unit template matrix) from _GLYPHS_PATH, or (None, None)."""
+    try:
+        with np.load(_GLYPHS_PATH) as f:
+            labels, glyphs = f["labels"], f["glyphs"]
+    except (OSError, KeyError):
+        return None, None
+    if set(labels.tolist()) != set(_GLYPH_CHARS):
+        return None, None
+    return labels, glyphs
+
+
+_GLYPH_LABELS, _GLYPHS = _load_glyphs()
+
+
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
-def _grab(sct, left, top, width, height) -> np.ndarray:
+# Reused BGR buffers for the per-tick grabs (HP and MP are the same size but
+# separate, so both frames can be alive at once)
+_HP_BUF = np.empty((_HP_REGION[3], _HP_REGION[2], 3), dtype=np.uint8)
+_MP_BUF = np.empty((_MP_REGION[3], _MP_REGION[2], 3), dtype=np.uint8)
+
+# OCR prep buffers for a 4x-upscaled HP/MP crop (both regions are the same
+# size; HP is fully OCR'd before MP is prepared, so they can share)
+_OCR_SCALE  = 4
+_OCR_SHAPE  = (_HP_REGION[3] * _OCR_SCALE, _HP_REGION[2] * _OCR_SCALE)
+_BIG_BUF    = np.empty((*_OCR_SHAPE, 3), dtype=np.uint8)
+_GRAY_BUF   = np.empty(_OCR_SHAPE, dtype=np.uint8)
+_THRESH_BUF = np.empty(_OCR_SHAPE, dtype=np.uint8)
+
+# HP over MP with a black gap, OCR'd as one two-line image (one Tesseract run)
+_OCR_GAP   = 10
+_STACK_BUF = np.zeros((2 * _OCR_SHAPE[0] + _OCR_GAP, _OCR_SHAPE[1]), dtype=np.uint8)
+
+_DIGITS_WHITELIST = "-c tessedit_char_whitelist=0123456789/ "
+
+
+def _grab(sct, left, top, width, height, dst: np.ndarray | None = None) -> np.ndarray:
+    """Capture a region as BGR straight from mss's raw BGRA buffer (no copy)."""
     shot = sct.grab({"left": left, "top": top, "width": width, "height": height})
-    frame = np.array(shot)
-    return cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+    bgra = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+    if dst is not None and dst.shape[:2] == bgra.shape[:2]:
+        return cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR, dst=dst)
+    return cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR)
 
 
 def _is_enemy_panel(sct) -> bool:
@@ -68,13 +120,32 @@ def _is_enemy_panel(sct) -> bool:
     return True
 
 
+def _threshold_for_ocr(frame: np.ndarray, dst: np.ndarray | None = None) -> np.ndarray:
+    """Upscale + threshold light text on dark background (into dst if given)."""
+    h, w = frame.shape[0] * _OCR_SCALE, frame.shape[1] * _OCR_SCALE
+    if (h, w) == _OCR_SHAPE:
+        big  = cv2.resize(frame, (w, h), dst=_BIG_BUF, interpolation=cv2.INTER_LINEAR)
+        gray = cv2.cvtColor(big, cv2.COLOR_BGR2GRAY, dst=_GRAY_BUF)
+        _, thresh = cv2.threshold(gray, 130, 255, cv2.THRESH_BINARY,
+                                  dst=_THRESH_BUF if dst is None else dst)
+    else:
+        big  = cv2.resize(frame, (w, h), interpolation=cv2.INTER_LINEAR)
+        gray = cv2.cvtColor(big, cv2.COLOR_BGR2GRAY)
+        _, thresh = cv2.threshold(gray, 130, 255, cv2.THRESH_BINARY)
+    return thresh
+
+
+def _as_image(gray: np.ndarray):
+    """Wrap a contiguous 8-bit array as a PIL image (fromarray would copy)."""
+    return Image.frombuffer("L", (gray.shape[1], gray.shape[0]), gray, "raw", "L", 0, 1)
+
+
 def _preprocess_for_ocr(frame: np.ndarray):
-    """Upscale + threshold light text on dark background."""
-    big = cv2.resize(frame, (frame.shape[1] * 4, frame.shape[0] * 4),
-                     interpolation=cv2.INTER_CUBIC)
-    gray = cv2.cvtColor(big, cv2.COLOR_BGR2GRAY)
-    _, thresh = cv2.threshold(gray, 130, 255, cv2.THRESH_BINARY)
-    return Image.fromarray(thresh)
+    """
+    Upscale + threshold light text on dark background.
+    The returned image is a view of _THRESH_BUF — OCR it before the next call.
+    """
+    return _as_image(_threshold_for_ocr(frame))
 
 
 def _ocr_pair(img, max_plausible: int) -> tuple | None:
@@ -84,9 +155,13 @@ def _ocr_pair(img, max_plausible: int) -> tuple | None:
     """
     raw = pytesseract.image_to_string(
         img,
-        config="--psm 7 --oem 3 -c tessedit_char_whitelist=0123456789/ "
+        config=f"--psm 7 --oem 3 {_DIGITS_WHITELIST}"
     ).strip()
+    return _parse_pair(raw, max_plausible)
 
+
+def _parse_pair(raw: str, max_plausible: int) -> tuple | None:
+    """Sanity-checked (current, max) from one line of OCR text, or None."""
     nums = re.findall(r'\d+', raw)
     if len(nums) < 2:
         return None
@@ -111,6 +186,113 @@ def _ocr_pair(img, max_plausible: int) -> tuple | None:
     return cur, mx
 
 
+# Last OCR per region: (crc32 of the BGR crop, parsed pair). The panel text
+# changes a few times a second at most, so most ticks skip Tesseract.
+_OCR_CACHE: dict[str, tuple] = {}
+
+
+def _glyph_boxes(frame: np.ndarray) -> tuple:
+    """(binary crop, left-to-right (x, y, w, h) boxes of its bright components)."""
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    _, binary = cv2.threshold(gray, 130, 255, cv2.THRESH_BINARY)
+    _, _, stats, _ = cv2.connectedComponentsWithStats(binary, connectivity=8)
+    boxes = sorted((tuple(s[:4]) for s in stats[1:] if s[4] >= _GLYPH_MIN_AREA),
+                   key=lambda b: b[0])
+    return binary, boxes
+
+
+def _glyph_vector(glyph: np.ndarray) -> np.ndarray:
+    """Unit-length feature vector of one glyph crop (aspect kept by padding)."""
+    gw, gh = _GLYPH_SIZE
+    h, w = glyph.shape
+    pad = max(0, round(h * gw / gh) - w)
+    if pad:
+        glyph = cv2.copyMakeBorder(glyph, 0, 0, pad // 2, pad - pad // 2,
+                                   cv2.BORDER_CONSTANT, value=0)
+    v = cv2.resize(glyph, _GLYPH_SIZE, interpolation=cv2.INTER_AREA).astype(np.float32).ravel()
+    norm = float(np.linalg.norm(v))
+    return v / norm if norm else v
+
+
+def _match_digits(frame: np.ndarray) -> str | None:
+    """
+    Panel text (e.g. "500/850") from glyph templates, "" for a blank crop,
+    or None when templates are missing or any glyph is not a confident match.
+    """
+    if _GLYPHS is None:
+        return None
+    binary, boxes = _glyph_boxes(frame)
+    if not boxes:
+        return ""
+    feats  = np.stack([_glyph_vector(binary[y:y + h, x:x + w]) for x, y, w, h in boxes])
+    scores = feats @ _GLYPHS.T                    # cosine similarity per glyph × char
+    best   = scores.argmax(axis=1)
+    if scores[np.arange(len(best)), best].min() < _GLYPH_MIN_SCORE:
+        return None
+    return "".join(_GLYPH_LABELS[best])
+
+
+def _ocr_pair_cached(region: str, frame: np.ndarray, max_plausible: int,
+                     sig: int | None = None) -> tuple | None:
+    """_ocr_pair, reusing the last result while the crop's pixels are unchanged."""
+    if sig is None:
+        sig = zlib.crc32(frame)
+    hit = _OCR_CACHE.get(region)
+    if hit is not None and hit[0] == sig:
+        return hit[1]
+    pair = _ocr_pair(_preprocess_for_ocr(frame), max_plausible)
+    _OCR_CACHE[region] = (sig, pair)
+    return pair
+
+
+def _ocr_hp_mp(hp_frame: np.ndarray, mp_frame: np.ndarray) -> tuple:
+    """
+    (hp_pair, mp_pair) for the two panel crops. Changed crops are read from
+    the digit glyphs first; whatever is left goes to Tesseract — both crops
+    stacked into a single run, or each on its own if that doesn't yield
+    exactly two lines (e.g. a manaless champion).
+    """
+    crops = {"hp": (hp_frame, _MAX_PLAUSIBLE_HP), "mp": (mp_frame, _MAX_PLAUSIBLE_MANA)}
+    pairs: dict[str, tuple | None] = {}
+    todo:  dict[str, int] = {}                    # region → crc32, still unread
+
+    for region, (frame, max_plausible) in crops.items():
+        sig = zlib.crc32(frame)
+        hit = _OCR_CACHE.get(region)
+        if hit is not None and hit[0] == sig:
+            pairs[region] = hit[1]
+            continue
+        text = _match_digits(frame)
+        if text is None:
+            todo[region] = sig
+            continue
+        pairs[region] = _parse_pair(text, max_plausible)
+        _OCR_CACHE[region] = (sig, pairs[region])
+
+    if todo and not _OCR_READY:
+        return pairs.get("hp"), pairs.get("mp")
+
+    if len(todo) == 2 and hp_frame.shape == mp_frame.shape == _HP_BUF.shape:
+        h = _OCR_SHAPE[0]
+        _threshold_for_ocr(hp_frame, dst=_STACK_BUF[:h])
+        _threshold_for_ocr(mp_frame, dst=_STACK_BUF[h + _OCR_GAP:])
+        raw = pytesseract.image_to_string(
+            _as_image(_STACK_BUF),
+            config=f"--psm 6 --oem 3 {_DIGITS_WHITELIST}"
+        )
+        lines = [ln for ln in raw.splitlines() if ln.strip()]
+        if len(lines) == 2:
+            for (region, sig), line in zip(todo.items(), lines):
+                pairs[region] = _parse_pair(line, crops[region][1])
+                _OCR_CACHE[region] = (sig, pairs[region])
+            todo.clear()
+
+    for region, sig in todo.items():
+        frame, max_plausible = crops[region]
+        pairs[region] = _ocr_pair_cached(region, frame, max_plausible, sig)
+    return pairs["hp"], pairs["mp"]
+
+
 # ── Public API ────────────────────────────────────────────────────────────────
 
 def read_target_panel(sct) -> dict:
@@ -148,7 +330,7 @@ def read_target_panel(sct) -> dict:
         "mp_percent":   None,
     }
 
-    if not _OCR_READY:
+    if not _OCR_READY and _GLYPHS is None:
         return result
 
     try:
@@ -156,9 +338,11 @@ def read_target_panel(sct) -> dict:
         if not _is_enemy_panel(sct):
             return result
 
+        hp_frame = _grab(sct, *_HP_REGION, dst=_HP_BUF)
+        mp_frame = _grab(sct, *_MP_REGION, dst=_MP_BUF)
+        hp_pair, mp_pair = _ocr_hp_mp(hp_frame, mp_frame)
+
         # ── HP ──
-        hp_frame = _grab(sct, *_HP_REGION)
-        hp_pair  = _ocr_pair(_preprocess_for_ocr(hp_frame), _MAX_PLAUSIBLE_HP)
         if hp_pair:
             cur, mx = hp_pair
             result["hp_current"]  = cur
@@ -167,8 +351,6 @@ def read_target_panel(sct) -> dict:
             result["panel_active"] = True
 
         # ── Mana ──
-        mp_frame = _grab(sct, *_MP_REGION)
-        mp_pair  = _ocr_pair(_preprocess_for_ocr(mp_frame), _MAX_PLAUSIBLE_MANA)
         if mp_pair:
             cur, mx = mp_pair
             result["mp_current"] = cur
@@ -203,7 +385,7 @@ def calibrate_target_panel(sct):
     print(f"Panel detected as: {'ENEMY (red)' if enemy else 'ALLY (green) or NONE'}")
 
     # Debug: show actual HSV values in the sample region
-    sample = _grab(sct, *_HP_BAR_SAMPLE)
+    sample = bar_sample
     hsv = cv2.cvtColor(sample, cv2.COLOR_BGR2HSV)
     avg_hsv = hsv.mean(axis=(0,1))
     print(f"HP bar sample avg HSV: H={avg_hsv[0]:.1f} S={avg_hsv[1]:.1f} V={avg_hsv[2]:.1f}")
@@ -214,17 +396,61 @@ def calibrate_target_panel(sct):
     print(f"Green pixels: {cv2.countNonZero(green)} / {sample.shape[0]*sample.shape[1]} total")
 
     if _OCR_READY:
+        # One preprocess + Tesseract run per region; the parsed lines reuse
+        # the raw text instead of OCR-ing the same crop again
         hp_raw = pytesseract.image_to_string(
             _preprocess_for_ocr(hp_frame),
-            config="--psm 7 --oem 3 -c tessedit_char_whitelist=0123456789/ "
+            config=f"--psm 7 --oem 3 {_DIGITS_WHITELIST}"
         ).strip()
         mp_raw = pytesseract.image_to_string(
             _preprocess_for_ocr(mp_frame),
-            config="--psm 7 --oem 3 -c tessedit_char_whitelist=0123456789/ "
+            config=f"--psm 7 --oem 3 {_DIGITS_WHITELIST}"
         ).strip()
         print(f"HP OCR raw : {repr(hp_raw)}")
         print(f"MP OCR raw : {repr(mp_raw)}")
-        print(f"HP parsed  : {_ocr_pair(_preprocess_for_ocr(hp_frame), _MAX_PLAUSIBLE_HP)}")
-        print(f"MP parsed  : {_ocr_pair(_preprocess_for_ocr(mp_frame), _MAX_PLAUSIBLE_MANA)}")
+        print(f"HP parsed  : {_parse_pair(hp_raw, _MAX_PLAUSIBLE_HP)}")
+        print(f"MP parsed  : {_parse_pair(mp_raw, _MAX_PLAUSIBLE_MANA)}")
 
     print("Saved target_panel_calibration.png (top=HP, mid=MP, bottom=bar color sample)")
+
+
+def calibrate_digit_glyphs(sct):
+    """
+    Debug tool — run in-game with an enemy clicked. Labels the glyphs of the
+    HP/MP text with Tesseract and saves them as templates to _GLYPHS_PATH.
+    Repeat at different HP/mana values until no characters are missing.
+    """
+    global _GLYPH_LABELS, _GLYPHS
+    if not _OCR_READY:
+        print("pytesseract/PIL not installed — cannot label glyphs")
+        return
+
+    known = {}
+    try:
+        with np.load(_GLYPHS_PATH) as f:
+            known = dict(zip(f["labels"].tolist(), f["glyphs"]))
+    except (OSError, KeyError):
+        pass
+
+    for name, region in (("HP", _HP_REGION), ("MP", _MP_REGION)):
+        frame = _grab(sct, *region)
+        raw = pytesseract.image_to_string(
+            _preprocess_for_ocr(frame),
+            config=f"--psm 7 --oem 3 {_DIGITS_WHITELIST}"
+        )
+        chars = [c for c in raw if c in _GLYPH_CHARS]
+        binary, boxes = _glyph_boxes(frame)
+        if len(chars) != len(boxes):
+            print(f"{name}: OCR {''.join(chars)!r} vs {len(boxes)} glyphs — skipped")
+            continue
+        for c, (x, y, w, h) in zip(chars, boxes):
+            known.setdefault(c, _glyph_vector(binary[y:y + h, x:x + w]))
+        print(f"{name}: captured {''.join(chars)!r}")
+
+    if known:
+        labels = sorted(known)
+        np.savez(_GLYPHS_PATH, labels=np.array(labels),
+                 glyphs=np.stack([known[c] for c in labels]))
+    missing = "".join(c for c in _GLYPH_CHARS if c not in known)
+    print(f"Missing glyphs: {missing!r}" if missing else f"All glyphs saved to {_GLYPHS_PATH}")
+    _GLYPH_LABELS, _GLYPHS = _load_glyphs()